@@ -3,55 +3,45 @@
 cleanup_all.py - Complete System Cleanup
 """
 
-import subprocess
+import asyncio
 import sys
 from config import Config
+from shared.command_utils import run_steps
 
-def run_cmd(cmd, cwd=None):
-    """Execute command"""
-    print(f"🔄 {cmd}")
-    result = subprocess.run(cmd, shell=True, cwd=cwd)
-    if result.returncode != 0:
-        print(f"⚠️ Failed (ignored): {cmd}")
-    else:
-        print(f"✅ Completed: {cmd}")
-
-def cleanup_step(name, commands):
-    """Execute cleanup step"""
-    print(f"\n🧹 {name}")
-    for cmd, cwd in commands:
-        run_cmd(cmd, cwd)
-
-def main():
+async def main():
     print("🧹 AI Fund Manager System Cleanup")
     print(f"📍 Target Region: {Config.REGION}")
-    
+
     response = input("Are you sure you want to delete all resources? (y/N): ")
     if response.lower() != 'y':
         print("❌ Cancelled")
         return 0
-    
-    # Cleanup steps (reverse order)
+
+    delete_local = input("Do you also want to delete locally generated files? (y/N): ").lower() == 'y'
+
+    # Answers for the confirmation prompts of each lab's cleanup.py
+    stdin_text = "y\n" + ("y\n" if delete_local else "n\n")
+
+    # Cleanup steps (labs are independent and cleaned up concurrently)
     steps = [
         ("Lab 4: Fund Manager", [
-            ("python cleanup.py", "fund_manager")
+            ((sys.executable, "cleanup.py"), "fund_manager")
         ]),
         ("Lab 3: Risk Manager", [
-            ("python cleanup.py", "risk_manager")
+            ((sys.executable, "cleanup.py"), "risk_manager")
         ]),
         ("Lab 2: Portfolio Architect", [
-            ("python cleanup.py", "portfolio_architect")
+            ((sys.executable, "cleanup.py"), "portfolio_architect")
         ]),
         ("Lab 1: Financial Analyst", [
-            ("python cleanup.py", "financial_analyst")
+            ((sys.executable, "cleanup.py"), "financial_analyst")
         ])
     ]
-    
-    for name, commands in steps:
-        cleanup_step(name, commands)
-    
+
+    await run_steps(steps, icon="🧹", stdin_text=stdin_text, ignore_errors=True)
+
     print("\n🎉 Cleanup Complete!")
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
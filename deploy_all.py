@@ -3,69 +3,73 @@
 deploy_all.py - Complete System Deployment
 """
 
-import subprocess
+import asyncio
 import sys
-from pathlib import Path
 from config import Config
+from shared.command_utils import run_cmd, run_steps
 
-def run_cmd(cmd, cwd=None):
-    """Execute command"""
-    print(f"🔄 {cmd}")
-    result = subprocess.run(cmd, shell=True, cwd=cwd)
-    if result.returncode != 0:
-        print(f"❌ Failed: {cmd}")
-        return False
-    print(f"✅ Completed: {cmd}")
+async def deploy_stage(steps):
+    """Execute independent deployment steps concurrently"""
+    while steps:
+        failed = await run_steps(steps, icon="🎯")
+        if not failed:
+            break
+        print(f"\n❌ Failed steps: {', '.join(failed)}")
+        for name, skipped in failed.items():
+            for argv, cwd in skipped:
+                print(f"   [{name}] Not run yet: {' '.join(argv)} ({cwd})")
+        response = input("Do you want to continue with the remaining commands? (y/N): ")
+        if response.lower() != 'y':
+            return False
+        # A failed command doesn't end its lab: the rest of the lab's commands still run, as they did sequentially
+        steps = [(name, skipped) for name, skipped in failed.items() if skipped]
     return True
 
-def deploy_step(name, commands):
-    """Execute deployment step"""
-    print(f"\n🎯 {name}")
-    for cmd, cwd in commands:
-        if not run_cmd(cmd, cwd):
-            response = input("Do you want to continue? (y/N): ")
-            if response.lower() != 'y':
-                return False
-    return True
-
-def main():
+async def main():
     print("🚀 AI Fund Manager System Deployment")
     print(f"📍 Deployment Region: {Config.REGION}")
     print(f"🏗️ Agent Configuration: {Config.FINANCIAL_ANALYST_NAME}, {Config.PORTFOLIO_ARCHITECT_NAME}, {Config.RISK_MANAGER_NAME}, {Config.FUND_MANAGER_NAME}")
-    
+
     # AWS verification
-    if not run_cmd("aws sts get-caller-identity"):
+    if not await run_cmd(("aws", "sts", "get-caller-identity")):
         print("❌ Please configure AWS credentials: aws configure")
         return 1
-    
-    # Deployment steps
-    steps = [
-        ("Lab 1: Financial Analyst", [
-            ("python deploy.py", "financial_analyst")
-        ]),
-        ("Lab 2: Portfolio Architect", [
-            ("python deploy_mcp.py", "portfolio_architect/mcp_server"),
-            ("python deploy.py", "portfolio_architect")
-        ]),
-        ("Lab 3: Risk Manager", [
-            ("python deploy_lambda_layer.py", "risk_manager/lambda_layer"),
-            ("python deploy_lambda.py", "risk_manager/lambda"),
-            ("python deploy_gateway.py", "risk_manager/gateway"),
-            ("python deploy.py", "risk_manager")
-        ]),
-        ("Lab 4: Fund Manager", [
-            ("python deploy_agentcore_memory.py", "fund_manager/agentcore_memory"),
-            ("python deploy.py", "fund_manager")
-        ])
+
+    # Deployment stages (steps within a stage are independent and run concurrently)
+    stages = [
+        [
+            ("Lab 1: Financial Analyst", [
+                ((sys.executable, "deploy.py"), "financial_analyst")
+            ]),
+            ("Lab 2: Portfolio Architect", [
+                ((sys.executable, "deploy_mcp.py"), "portfolio_architect/mcp_server"),
+                ((sys.executable, "deploy.py"), "portfolio_architect")
+            ]),
+            ("Lab 3: Risk Manager", [
+                ((sys.executable, "deploy_lambda_layer.py"), "risk_manager/lambda_layer"),
+                ((sys.executable, "deploy_lambda.py"), "risk_manager/lambda"),
+                ((sys.executable, "deploy_gateway.py"), "risk_manager/gateway"),
+                ((sys.executable, "deploy.py"), "risk_manager")
+            ]),
+            ("Lab 4: Fund Manager Memory", [
+                ((sys.executable, "deploy_agentcore_memory.py"), "fund_manager/agentcore_memory")
+            ])
+        ],
+        # Fund Manager requires the deployment information of Labs 1-3
+        [
+            ("Lab 4: Fund Manager", [
+                ((sys.executable, "deploy.py"), "fund_manager")
+            ])
+        ]
     ]
-    
-    for name, commands in steps:
-        if not deploy_step(name, commands):
+
+    for steps in stages:
+        if not await deploy_stage(steps):
             return 1
-    
+
     print("\n🎉 Deployment Complete!")
     print("Run web app: cd fund_manager && streamlit run app.py")
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file
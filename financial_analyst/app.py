@@ -8,42 +8,73 @@ AI Financial Analyst Web Interface
 import streamlit as st
 import json
 import os
-import boto3
+import sys
+import time
 from pathlib import Path
 
+# Shared modules live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.json_utils import json_loads
+from shared.stream_utils import iter_sse_data
+
 st.set_page_config(page_title="Financial Analyst")
 st.title("💰 Financial Analyst")
 
+@st.cache_data
+def load_deployment_info():
+    """Load deployment information (read once and reused across reruns)"""
+    with open(Path(__file__).parent / "deployment_info.json") as f:
+        return json.load(f)
+
 # Load deployment information
 try:
-    with open(Path(__file__).parent / "deployment_info.json") as f:
-        deployment_info = json.load(f)
+    deployment_info = load_deployment_info()
     AGENT_ARN = deployment_info["agent_arn"]
     REGION = deployment_info["region"]
 except Exception:
     st.error("Deployment information not found. Please run deploy.py first.")
     st.stop()
 
-agentcore_client = boto3.client('bedrock-agentcore', region_name=REGION)
+@st.cache_resource
+def get_agentcore_client(region):
+    """Create AgentCore client shared across Streamlit reruns and sessions"""
+    import boto3
+    from botocore.config import Config as BotocoreConfig
+    
+    client_config = BotocoreConfig(
+        max_pool_connections=50,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 3}
+    )
+    return boto3.client('bedrock-agentcore', region_name=region, config=client_config)
+
+agentcore_client = get_agentcore_client(REGION)
+
+# Minimum interval between streaming text re-renders (seconds)
+RENDER_INTERVAL = 0.05
+
+# Response stream read size (bytes)
+STREAM_CHUNK_SIZE = 8192
 
 def display_financial_analysis(trace_container, result):
     """Display financial analysis results"""
+    get = result.get
     trace_container.markdown("**Overall Assessment**")
-    trace_container.info(result.get("summary", ""))
+    trace_container.info(get("summary", ""))
 
     col1, col2 = trace_container.columns(2)
     
     with col1:
-        st.metric("**Risk Profile**", result.get("risk_profile", "N/A"))
+        st.metric("**Risk Profile**", get("risk_profile", "N/A"))
         st.markdown("**Risk Profile Analysis**")
-        st.write(result.get("risk_profile_reason", ""))
+        st.write(get("risk_profile_reason", ""))
     
     with col2:
-        st.metric("**Required Return**", f"{result.get('required_annual_return_rate', 'N/A')}%")
+        st.metric("**Required Return**", f"{get('required_annual_return_rate', 'N/A')}%")
         
         # Display recommended investment sectors as tags
         st.markdown("**🎯 Recommended Investment Sectors**")
-        sectors = result.get("key_sectors", [])
+        sectors = get("key_sectors", [])
         tag_html = ""
         for sector in sectors:
             tag_html += f'<span style="background-color: #e8f5e8; color: #2e7d32; padding: 4px 8px; margin: 2px; border-radius: 12px; font-size: 12px; display: inline-block;">{sector}</span> '
@@ -54,8 +85,17 @@ def display_calculator_result(trace_container, tool_input, result_text):
     trace_container.markdown("**Return Rate Calculated by Calculator Tool**")
     trace_container.code(f"Input: {tool_input}\n\n{result_text}", language="text")
 
+def render_thinking(text_placeholder, chunks):
+    """Render accumulated streaming text"""
+    text = "".join(chunks)
+    if text.strip():
+        with text_placeholder.chat_message("assistant"):
+            st.markdown(text)
+
 def invoke_financial_advisor(input_data):
     """Invoke AgentCore Runtime"""
+    response = None
+    terminal_event = False
     try:
         response = agentcore_client.invoke_agent_runtime(
             agentRuntimeArn=AGENT_ARN,
@@ -66,68 +106,93 @@ def invoke_financial_advisor(input_data):
         placeholder = st.container()
         placeholder.markdown("🤖 **Financial Analyst**")
 
-        current_thinking = ""
+        thinking_chunks = []
+        pending_render = False
+        last_render = 0.0
         current_text_placeholder = placeholder.empty()
         tool_id_to_name = {}
         tool_id_to_input = {}
 
-        for line in response["response"].iter_lines(chunk_size=1):
-            if line and line.decode("utf-8").startswith("data: "):
-                try:
-                    event_data = json.loads(line.decode("utf-8")[6:])
-                    event_type = event_data.get("type")
-
-                    if event_type == "text_chunk":
-                        chunk_data = event_data.get("data", "")
-                        current_thinking += chunk_data
-                        if current_thinking.strip():
-                            with current_text_placeholder.chat_message("assistant"):
-                                st.markdown(current_thinking)
-                    
-                    elif event_type == "tool_use":
-                        tool_name = event_data.get("tool_name", "")
-                        tool_use_id = event_data.get("tool_use_id", "")
-                        tool_input = event_data.get("tool_input", "")
-
-                        actual_tool_name = tool_name.split("___")[-1] if "___" in tool_name else tool_name
-                        tool_id_to_name[tool_use_id] = actual_tool_name
-                        tool_id_to_input[tool_use_id] = tool_input
+        for payload in iter_sse_data(response["response"], STREAM_CHUNK_SIZE):
+            try:
+                event_data = json_loads(payload)
+                get = event_data.get
+                event_type = get("type")
+
+                # Flush coalesced text before handling any other event
+                if event_type != "text_chunk" and pending_render:
+                    render_thinking(current_text_placeholder, thinking_chunks)
+                    pending_render = False
+
+                if event_type == "text_chunk":
+                    thinking_chunks.append(get("data", ""))
+                    pending_render = True
+                    now = time.monotonic()
+                    if now - last_render >= RENDER_INTERVAL:
+                        render_thinking(current_text_placeholder, thinking_chunks)
+                        pending_render = False
+                        last_render = now
+                
+                elif event_type == "tool_use":
+                    tool_name = get("tool_name", "")
+                    tool_use_id = get("tool_use_id", "")
+                    tool_input = get("tool_input", "")
+
+                    actual_tool_name = tool_name.split("___")[-1] if "___" in tool_name else tool_name
+                    tool_id_to_name[tool_use_id] = actual_tool_name
+                    tool_id_to_input[tool_use_id] = tool_input
+                
+                elif event_type == "tool_result":
+                    tool_use_id = get("tool_use_id", "")
+                    actual_tool_name = tool_id_to_name.pop(tool_use_id, "unknown")
+                    tool_input = tool_id_to_input.pop(tool_use_id, "unknown")
+                    tool_content = get("content", [{}])
                     
-                    elif event_type == "tool_result":
-                        tool_use_id = event_data.get("tool_use_id", "")
-                        actual_tool_name = tool_id_to_name.get(tool_use_id, "unknown")
-                        tool_input = tool_id_to_input.get(tool_use_id, "unknown")
-                        tool_content = event_data.get("content", [{}])
-                        
-                        if tool_content and len(tool_content) > 0:
-                            result_text = tool_content[0].get("text", "{}")
-                            
-                            if actual_tool_name == "calculator":
-                                display_calculator_result(placeholder, tool_input, result_text)
+                    if tool_content and len(tool_content) > 0:
+                        result_text = tool_content[0].get("text", "{}")
                         
-                        current_thinking = ""
-                        if tool_use_id in tool_id_to_name:
-                            del tool_id_to_name[tool_use_id]
-                        current_text_placeholder = placeholder.empty()
+                        if actual_tool_name == "calculator":
+                            display_calculator_result(placeholder, tool_input, result_text)
                     
-                    elif event_type == "streaming_complete":
-                        result_str = event_data.get("result", "")
-                        result = json.loads(result_str)
-                        
-                        placeholder.divider()
-                        placeholder.subheader("📌 Financial Analysis Results")
-                        display_financial_analysis(placeholder, result)
+                    thinking_chunks = []
+                    current_text_placeholder = placeholder.empty()
+                
+                elif event_type == "streaming_complete":
+                    result_str = get("result", "")
+                    result = json_loads(result_str)
+                    
+                    placeholder.divider()
+                    placeholder.subheader("📌 Financial Analysis Results")
+                    display_financial_analysis(placeholder, result)
+                    terminal_event = True
+                    return {"status": "success"}
 
-                    elif event_type == "error":
-                        return {"status": "error", "error": event_data.get("error", "Unknown error")}
-                        
-                except json.JSONDecodeError:
-                    continue
+                elif event_type == "error":
+                    terminal_event = True
+                    return {"status": "error", "error": get("error", "Unknown error")}
+                    
+            except json.JSONDecodeError:
+                continue
+
+        if pending_render:
+            render_thinking(current_text_placeholder, thinking_chunks)
 
         return {"status": "success"}
 
     except Exception as e:
         return {"status": "error", "error": str(e)}
+    finally:
+        if response:
+            body = response["response"]
+            # urllib3 returns the connection to the pool only once the body is fully read; closing a
+            # partially read body discards the connection. After a terminal event only the end of the
+            # stream remains, so read it to keep the keep-alive connection reusable.
+            if terminal_event:
+                try:
+                    body.read()
+                except Exception:
+                    pass
+            body.close()
 
 # UI Configuration
 with st.expander("🏗️ Financial Analyst Architecture", expanded=True):
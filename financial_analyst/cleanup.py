@@ -6,9 +6,9 @@ Delete and clean up all AWS resources
 """
 
 import json
-import boto3
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Config classes no longer needed - use region information directly from deployment info
@@ -23,6 +23,7 @@ def load_deployment_info():
 
 def delete_runtime(agent_arn, region):
     """Delete Runtime"""
+    import boto3  # Imported lazily so the cancel path skips loading botocore
     try:
         runtime_id = agent_arn.split('/')[-1]
         client = boto3.client('bedrock-agentcore-control', region_name=region)
@@ -35,6 +36,7 @@ def delete_runtime(agent_arn, region):
 
 def delete_ecr_repo(repo_name, region):
     """Delete ECR repository"""
+    import boto3
     try:
         ecr = boto3.client('ecr', region_name=region)
         ecr.delete_repository(repositoryName=repo_name, force=True)
@@ -46,18 +48,33 @@ def delete_ecr_repo(repo_name, region):
 
 def delete_iam_role(role_name):
     """Delete IAM role"""
+    import boto3
     try:
         iam = boto3.client('iam')
         
-        # Delete inline policies
-        policies = iam.list_role_policies(RoleName=role_name)
-        for policy in policies['PolicyNames']:
-            iam.delete_role_policy(RoleName=role_name, PolicyName=policy)
+        # Collect all policies (paginated)
+        policy_names = [
+            name
+            for page in iam.get_paginator('list_role_policies').paginate(RoleName=role_name)
+            for name in page['PolicyNames']
+        ]
+        policy_arns = [
+            policy['PolicyArn']
+            for page in iam.get_paginator('list_attached_role_policies').paginate(RoleName=role_name)
+            for policy in page['AttachedPolicies']
+        ]
         
-        # Detach managed policies
-        attached_policies = iam.list_attached_role_policies(RoleName=role_name)
-        for policy in attached_policies['AttachedPolicies']:
-            iam.detach_role_policy(RoleName=role_name, PolicyArn=policy['PolicyArn'])
+        # Delete inline policies and detach managed policies concurrently (8 workers stay within IAM throttling limits)
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(iam.delete_role_policy, RoleName=role_name, PolicyName=name)
+                for name in policy_names
+            ] + [
+                executor.submit(iam.detach_role_policy, RoleName=role_name, PolicyArn=arn)
+                for arn in policy_arns
+            ]
+            for future in futures:
+                future.result()
         
         # Delete role
         iam.delete_role(RoleName=role_name)
@@ -75,14 +92,18 @@ def cleanup_local_files():
         current_dir / "Dockerfile",
         current_dir / ".dockerignore", 
         current_dir / ".bedrock_agentcore.yaml",
+        current_dir / "json_utils.py",
+        current_dir / "model_utils.py",
     ]
     
     deleted_count = 0
     for file_path in files_to_delete:
-        if file_path.exists():
+        try:
             file_path.unlink()
-            print(f"✅ File deleted: {file_path.name}")
-            deleted_count += 1
+        except FileNotFoundError:
+            continue
+        print(f"✅ File deleted: {file_path.name}")
+        deleted_count += 1
     
     if deleted_count > 0:
         print(f"✅ Local file cleanup complete! ({deleted_count} files deleted)")
@@ -107,19 +128,23 @@ def main():
     
     print("\n🗑️ Deleting AWS resources...")
     
-    # 1. Delete Financial Analyst Runtime
-    if 'agent_arn' in deployment_info:
-        region = deployment_info.get('region', 'us-west-2')  # Default fallback
-        delete_runtime(deployment_info['agent_arn'], region)
+    region = deployment_info.get('region', 'us-west-2')  # Default fallback
     
-    # 2. Delete ECR repository
-    if 'ecr_repo_name' in deployment_info and deployment_info['ecr_repo_name']:
-        region = deployment_info.get('region', 'us-west-2')
-        delete_ecr_repo(deployment_info['ecr_repo_name'], region)
-    
-    # 3. Delete IAM role (IAM is global service, no region needed)
-    if 'iam_role_name' in deployment_info:
-        delete_iam_role(deployment_info['iam_role_name'])
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # 1. Delete Financial Analyst Runtime
+        runtime_future = None
+        if 'agent_arn' in deployment_info:
+            runtime_future = executor.submit(delete_runtime, deployment_info['agent_arn'], region)
+        
+        # 2. Delete ECR repository (independent of Runtime, runs concurrently)
+        if 'ecr_repo_name' in deployment_info and deployment_info['ecr_repo_name']:
+            executor.submit(delete_ecr_repo, deployment_info['ecr_repo_name'], region)
+        
+        # 3. Delete IAM role after the Runtime using it is deleted (IAM is global service, no region needed)
+        if runtime_future:
+            runtime_future.result()
+        if 'iam_role_name' in deployment_info:
+            delete_iam_role(deployment_info['iam_role_name'])
     
     print("\n🎉 AWS resource cleanup complete!")
     
@@ -5,6 +5,7 @@ Financial Analyst Deployment Script
 AgentCore Runtime deployment for Financial Analyst
 """
 
+import shutil
 import sys
 import time
 import json
@@ -17,12 +18,14 @@ sys.path.insert(0, str(root_path))
 sys.path.insert(0, str(root_path / "shared"))
 
 from config import Config as GlobalConfig
-from runtime_utils import create_agentcore_runtime_role
+from runtime_utils import create_agentcore_runtime_role, wait_for_runtime_ready
 
 class Config:
     """Financial Analyst deployment configuration"""
     REGION = GlobalConfig.REGION
     AGENT_NAME = GlobalConfig.FINANCIAL_ANALYST_NAME
+    DEPLOY_TIMEOUT = 900       # seconds
+    STATUS_POLL_INTERVAL = 5   # seconds
 
 def deploy_financial_analyst():
     """Deploy Financial Analyst Runtime"""
@@ -34,6 +37,11 @@ def deploy_financial_analyst():
     
     # Configure Runtime
     current_dir = Path(__file__).parent
+    
+    # The Runtime image is built from this directory only, so the shared modules are copied next to the entrypoint
+    for module_file in ("json_utils.py", "model_utils.py"):
+        shutil.copy2(root_path / "shared" / module_file, current_dir / module_file)
+    
     runtime = Runtime()
     runtime.configure(
         entrypoint=str(current_dir / "financial_analyst.py"),
@@ -47,16 +55,13 @@ def deploy_financial_analyst():
     # Execute deployment
     launch_result = runtime.launch(auto_update_on_conflict=True)
     
-    # Wait for deployment completion
-    for i in range(30):
-        try:
-            status = runtime.status().endpoint['status']
-            print(f"📊 Status: {status} ({i*30} seconds elapsed)")
-            if status in ['READY', 'CREATE_FAILED', 'DELETE_FAILED', 'UPDATE_FAILED']:
-                break
-        except Exception as e:
-            print(f"⚠️ Status check error: {e}")
-        time.sleep(30)
+    # Wait for deployment completion (returns as soon as the endpoint reaches a terminal status)
+    status = wait_for_runtime_ready(
+        launch_result.agent_id,
+        Config.REGION,
+        delay=Config.STATUS_POLL_INTERVAL,
+        max_attempts=Config.DEPLOY_TIMEOUT // Config.STATUS_POLL_INTERVAL
+    )
     
     if status != 'READY':
         raise Exception(f"Deployment failed: {status}")
@@ -5,12 +5,23 @@ Financial Analyst - AI Financial Analyst
 Personal financial situation analysis and risk profile assessment using Calculator tool
 """
 
-import json
-from strands import Agent
-from strands.models.bedrock import BedrockModel
-from strands_tools import calculator
+import asyncio
+import functools
+import re
+import sys
+from pathlib import Path
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
 
+try:
+    # Runtime container: deploy.py copies the shared modules next to this entrypoint
+    from json_utils import json_dumps, json_loads
+    from model_utils import normalize_model_id
+except ImportError:
+    # Local run: shared modules live at the repository root
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from shared.json_utils import json_dumps, json_loads
+    from shared.model_utils import normalize_model_id
+
 app = BedrockAgentCoreApp()
 
 class Config:
@@ -18,37 +29,87 @@ class Config:
     MODEL_ID = "openai.gpt-oss-120b-1:0"
     TEMPERATURE = 0.1
     MAX_TOKENS = 3000
+    STREAM_BUFFER_SIZE = 64   # Max events buffered between model stream and HTTP response
+    BATCH_CONCURRENCY = 8     # Max concurrent analyses per batch request (Bedrock throttling)
+
+@functools.cache
+def get_result_model():
+    """Fixed output schema of the financial analysis (pydantic is imported on first use)"""
+    from typing import List
+    from pydantic import BaseModel, Field
+
+    class FinancialAnalysisResult(BaseModel):
+        risk_profile: str = Field(description="Very Conservative|Conservative|Neutral|Aggressive|Very Aggressive")
+        risk_profile_reason: str = Field(description="Risk profile assessment reasoning (2-3 sentences)")
+        required_annual_return_rate: float = Field(description="Required return rate with 2 decimal places")
+        key_sectors: List[str] = Field(description="Three recommended investment sectors")
+        summary: str = Field(description="Overall assessment (3-4 sentences)")
+
+    return FinancialAnalysisResult
+
+# Characters relevant to JSON object boundaries
+JSON_STRUCTURE_CHARS = re.compile(r'[{}"\\]')
+
+def is_valid_json(text):
+    """Check whether text parses as JSON"""
+    try:
+        json_loads(text)
+        return True
+    except ValueError:
+        return False
+
+def iter_object_spans(text_content):
+    """Yield (start, end) of each top-level brace-balanced span in a single pass, ignoring braces inside string literals"""
+    # Regex scan in C jumps straight to structural characters; the stack holds open brace offsets
+    stack = []
+    in_string = False
+    escaped_idx = -1
+    for match in JSON_STRUCTURE_CHARS.finditer(text_content):
+        i = match.start()
+        if i == escaped_idx:
+            continue
+        char = match.group()
+        if in_string:
+            if char == '\\':
+                escaped_idx = i + 1
+            elif char == '"':
+                in_string = False
+        elif char == '{':
+            stack.append(i)
+        elif not stack:
+            # Quotes and stray braces in prose outside any object are not JSON structure
+            continue
+        elif char == '"':
+            in_string = True
+        elif char == '}':
+            start_idx = stack.pop()
+            if not stack:
+                yield start_idx, i + 1
 
 def extract_json_from_text(text_content):
-    """Extract only JSON part from AI response"""
+    """Extract only JSON part from AI response (first top-level object that parses)"""
     if not isinstance(text_content, str):
         return text_content
     
+    # Fast path: response is already a bare JSON object
+    if text_content.startswith('{') and text_content.endswith('}') and is_valid_json(text_content):
+        return text_content
+    
+    # A span that doesn't parse (e.g. "{braces}" in surrounding prose) is skipped and the same scan continues
+    for start_idx, end_idx in iter_object_spans(text_content):
+        candidate = text_content[start_idx:end_idx]
+        if is_valid_json(candidate):
+            return candidate
+    
+    # No parsable object: first '{' through last '}'
     start_idx = text_content.find('{')
     end_idx = text_content.rfind('}') + 1
-    
     if start_idx != -1 and end_idx > start_idx:
         return text_content[start_idx:end_idx]
     
     return text_content
 
-class FinancialAnalyst:
-    """AI Financial Analyst using Calculator tool"""
-    
-    def __init__(self):
-        self.agent = Agent(
-            name="financial_analyst",
-            model=BedrockModel(
-                model_id=Config.MODEL_ID,
-                temperature=Config.TEMPERATURE,
-                max_tokens=Config.MAX_TOKENS
-            ),
-            tools=[calculator],
-            system_prompt=self._get_prompt()
-        )
-        
-    def _get_prompt(self) -> str:
-        return """As a financial analysis expert, perform personalized investment analysis.
+SYSTEM_PROMPT = """As a financial analysis expert, perform personalized investment analysis.
 
 Input Data:
 - total_investable_amount: Available investment amount
@@ -72,48 +133,191 @@ Output:
 "summary": "Overall assessment (3-4 sentences)"
 }"""
 
+# Base model IDs supporting Bedrock prompt caching (cache points on unsupported models fail the request)
+PROMPT_CACHE_MODELS = frozenset({
+    "anthropic.claude-3-5-haiku-20241022-v1:0",
+    "anthropic.claude-3-7-sonnet-20250219-v1:0",
+    "anthropic.claude-sonnet-4-20250514-v1:0",
+    "anthropic.claude-sonnet-4-5-20250929-v1:0",
+    "anthropic.claude-haiku-4-5-20251001-v1:0",
+    "anthropic.claude-opus-4-20250514-v1:0",
+    "anthropic.claude-opus-4-1-20250805-v1:0"
+})
+
+SUPPORTS_PROMPT_CACHE = normalize_model_id(Config.MODEL_ID) in PROMPT_CACHE_MODELS
+
+@functools.cache
+def get_bedrock_model():
+    """Bedrock model shared by all analyses in this process (Strands is imported on first use)"""
+    from strands.models.bedrock import BedrockModel
+    
+    model_config = {
+        "model_id": Config.MODEL_ID,
+        "temperature": Config.TEMPERATURE,
+        "max_tokens": Config.MAX_TOKENS
+    }
+    if SUPPORTS_PROMPT_CACHE:
+        # Cache the static system prompt and tool definitions (calculator schema)
+        model_config["cache_prompt"] = "default"
+        model_config["cache_tools"] = "default"
+    return BedrockModel(**model_config)
+
+# Event templates (copying a prebuilt dict is cheaper than building a literal per event)
+TEXT_CHUNK_EVENT = {"type": "text_chunk", "data": None}
+TOOL_USE_EVENT = {"type": "tool_use", "tool_name": None, "tool_use_id": None, "tool_input": None}
+TOOL_RESULT_EVENT = {"type": "tool_result", "tool_use_id": None, "status": None, "content": None}
+STREAMING_COMPLETE_EVENT = {"type": "streaming_complete", "result": None}
+
+def text_chunk_events(data):
+    """Convert streamed text into text_chunk event"""
+    event = TEXT_CHUNK_EVENT.copy()
+    event["data"] = data
+    yield event
+
+def tool_use_events(content_list):
+    """Convert assistant message tool calls into tool_use events"""
+    for content in content_list:
+        tool_use = content.get("toolUse")
+        if tool_use:
+            event = TOOL_USE_EVENT.copy()
+            event["tool_name"] = tool_use.get("name")
+            event["tool_use_id"] = tool_use.get("toolUseId")
+            event["tool_input"] = tool_use.get("input", {})
+            yield event
+
+def tool_result_events(content_list):
+    """Convert user message tool results into tool_result events"""
+    for content in content_list:
+        tool_result = content.get("toolResult")
+        if tool_result:
+            event = TOOL_RESULT_EVENT.copy()
+            event["tool_use_id"] = tool_result["toolUseId"]
+            event["status"] = tool_result["status"]
+            event["content"] = tool_result["content"]
+            yield event
+
+MESSAGE_HANDLERS = {
+    "assistant": tool_use_events,
+    "user": tool_result_events
+}
+
+def message_events(message):
+    """Dispatch message content by role"""
+    handler = MESSAGE_HANDLERS.get(message.get("role"))
+    if handler:
+        yield from handler(message.get("content", []))
+
+def result_to_text(result):
+    """Get final response text without stringifying the whole result object"""
+    if isinstance(result, str):
+        return result
+    
+    # Strands AgentResult: join text blocks of the final message only
+    message = getattr(result, "message", None)
+    if isinstance(message, dict):
+        return "".join(content["text"] for content in message.get("content", []) if "text" in content)
+    
+    if isinstance(result, dict):
+        return json_dumps(result)
+    return str(result)
+
+def result_events(result):
+    """Convert final agent result into streaming_complete event"""
+    structured_output = getattr(result, "structured_output", None)
+    if structured_output is not None:
+        # Schema-validated output: serialize directly, no text extraction needed
+        clean_json = structured_output.model_dump_json()
+    else:
+        clean_json = extract_json_from_text(result_to_text(result))
+    event = STREAMING_COMPLETE_EVENT.copy()
+    event["result"] = clean_json
+    yield event
+
+# Strands stream event key -> handler (checked in this order for every event)
+EVENT_HANDLERS = {
+    "data": text_chunk_events,
+    "message": message_events,
+    "result": result_events
+}
+
+class FinancialAnalyst:
+    """AI Financial Analyst using Calculator tool"""
+    
+    def __init__(self):
+        from strands import Agent
+        from strands_tools import calculator
+        
+        self.agent = Agent(
+            name="financial_analyst",
+            model=get_bedrock_model(),
+            tools=[calculator],
+            system_prompt=SYSTEM_PROMPT
+        )
+
     async def analyze_financial_situation_async(self, user_input):
         """Real-time streaming financial analysis using Calculator tool"""
+        # Model stream is read by a producer task so slow clients don't stall it
+        queue = asyncio.Queue(maxsize=Config.STREAM_BUFFER_SIZE)
+        producer = asyncio.create_task(self._produce_events(user_input, queue))
         try:
-            user_input_str = json.dumps(user_input, ensure_ascii=False)
-
-            async for event in self.agent.stream_async(user_input_str):
-                if "data" in event:
-                    yield {"type": "text_chunk", "data": event["data"]}
-                
-                if "message" in event:
-                    message = event["message"]
-                    
-                    if message.get("role") == "assistant":
-                        for content in message.get("content", []):
-                            if "toolUse" in content:
-                                tool_use = content["toolUse"]
-                                yield {
-                                    "type": "tool_use",
-                                    "tool_name": tool_use.get("name"),
-                                    "tool_use_id": tool_use.get("toolUseId"),
-                                    "tool_input": tool_use.get("input", {})
-                                }
-                    
-                    if message.get("role") == "user":
-                        for content in message.get("content", []):
-                            if "toolResult" in content:
-                                tool_result = content["toolResult"]
-                                yield {
-                                    "type": "tool_result",
-                                    "tool_use_id": tool_result["toolUseId"],
-                                    "status": tool_result["status"],
-                                    "content": tool_result["content"]
-                                }
-                
-                if "result" in event:
-                    raw_result = str(event["result"])
-                    clean_json = extract_json_from_text(raw_result)
-                    yield {"type": "streaming_complete", "result": clean_json}
+            while (event := await queue.get()) is not None:
+                yield event
+        finally:
+            producer.cancel()
+
+    async def _produce_events(self, user_input, queue):
+        """Push analysis events into the bounded queue (None marks the end)"""
+        async for event in self._stream_events(user_input):
+            await queue.put(event)
+        await queue.put(None)
+
+    async def _stream_events(self, user_input):
+        """Convert Strands agent stream into analysis events"""
+        try:
+            user_input_str = json_dumps(user_input)
+
+            async for event in self.agent.stream_async(
+                user_input_str,
+                structured_output_model=get_result_model()
+            ):
+                for key, handler in EVENT_HANDLERS.items():
+                    value = event.get(key)
+                    if value is not None:
+                        for analysis_event in handler(value):
+                            yield analysis_event
 
         except Exception as e:
             yield {"type": "error", "error": str(e), "status": "error"}
 
+async def analyze_batch_async(inputs):
+    """Run analyses for multiple inputs concurrently (events are tagged with the input index)"""
+    queue = asyncio.Queue(maxsize=Config.STREAM_BUFFER_SIZE)
+    semaphore = asyncio.Semaphore(Config.BATCH_CONCURRENCY)
+    
+    async def run(index, user_input):
+        async with semaphore:
+            try:
+                # Separate agent per input so conversation histories don't mix
+                async for event in FinancialAnalyst().analyze_financial_situation_async(user_input):
+                    event["index"] = index
+                    await queue.put(event)
+            except Exception as e:
+                # One failing input is reported without aborting the rest of the batch
+                await queue.put({"type": "error", "error": str(e), "status": "error", "index": index})
+    
+    async def run_all():
+        try:
+            await asyncio.gather(*(run(index, user_input) for index, user_input in enumerate(inputs)))
+        finally:
+            await queue.put(None)
+    
+    producer = asyncio.create_task(run_all())
+    try:
+        while (event := await queue.get()) is not None:
+            yield event
+    finally:
+        producer.cancel()
+
 analyst = None
 
 @app.entrypoint
@@ -125,8 +329,17 @@ async def financial_analyst(payload):
         analyst = FinancialAnalyst()
 
     user_input = payload.get("input_data")
+    
+    # List input: batch of independent analyses (e.g. what-if scenarios)
+    if isinstance(user_input, list):
+        async for chunk in analyze_batch_async(user_input):
+            yield chunk
+        return
+    
     async for chunk in analyst.analyze_financial_situation_async(user_input):
         yield chunk
 
 if __name__ == "__main__":
+    # Build analyst before serving so the first request doesn't pay imports and agent setup
+    analyst = FinancialAnalyst()
     app.run()
\ No newline at end of file
@@ -5,35 +5,97 @@ AgentCore Memory Deployment Script
 Create Memory for Fund Manager and save deployment information
 """
 
+import importlib.util
 import json
+import logging
+import os
 import time
 import sys
 from pathlib import Path
-from bedrock_agentcore.memory import MemoryClient
 
-# Add common configuration path
-root_path = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(root_path))
-from config import Config as GlobalConfig
+def load_module_from_file(name, path):
+    """Load a module directly from its file (no global sys.path modification)"""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# Common configuration and shared JSON helpers
+root_path = Path(__file__).resolve().parents[2]
+GlobalConfig = load_module_from_file("config", root_path / "config.py").Config
+json_utils = load_module_from_file("json_utils", root_path / "shared" / "json_utils.py")
 
 class Config:
     REGION = GlobalConfig.REGION
     MEMORY_NAME = GlobalConfig.MEMORY_NAME
 
+# Status output (same plain message format as before, lazily formatted)
+logger = logging.getLogger("deploy_memory")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+if not logger.handlers:
+    log_handler = logging.StreamHandler(sys.stdout)
+    log_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(log_handler)
+
+def load_cached_memory_id(memory_client):
+    """Return memory ID from previous deployment if the memory still exists"""
+    info_file = Path(__file__).parent / "deployment_info.json"
+    try:
+        with open(info_file, 'rb') as f:
+            memory_id = json_utils.json_loads(f.read())["memory_id"]
+    except (FileNotFoundError, KeyError, json.JSONDecodeError):
+        return None
+    
+    try:
+        status = memory_client.get_memory_status(memory_id)
+    except Exception as e:
+        logger.warning("⚠️ Previously deployed memory not found: %s", e)
+        return None
+    
+    if status in ("FAILED", "DELETING"):
+        logger.warning("⚠️ Previously deployed memory is not usable: %s", status)
+        return None
+    return memory_id
+
+def find_existing_memory(memory_client):
+    """Find existing memory by name (stops paginating at the first match)"""
+    paginator = memory_client.gmcp_client.get_paginator('list_memories')
+    for page in paginator.paginate():
+        for memory in page.get('memories', []):
+            if memory['id'].startswith(Config.MEMORY_NAME):
+                return memory['id']
+    return None
+
 def deploy_memory():
     """Create AgentCore Memory"""
-    print("🧠 Creating AgentCore Memory...")
+    logger.info("🧠 Creating AgentCore Memory...")
+    
+    import boto3
+    import botocore.session
+    from botocore.config import Config as BotocoreConfig
+    from bedrock_agentcore.memory import MemoryClient
     
-    memory_client = MemoryClient(region_name=Config.REGION)
+    # Keep connections warm across status polls (MemoryClient takes a session, not a client config)
+    botocore_session = botocore.session.get_session()
+    botocore_session.set_default_client_config(BotocoreConfig(
+        retries={"max_attempts": 10, "mode": "adaptive"},
+        connect_timeout=5,
+        read_timeout=60,
+        tcp_keepalive=True,
+        max_pool_connections=10
+    ))
+    memory_client = MemoryClient(
+        region_name=Config.REGION,
+        boto3_session=boto3.Session(botocore_session=botocore_session)
+    )
     
     try:
-        # Check existing memory
-        memories = memory_client.list_memories()
-        existing_memory = next((m for m in memories if m['id'].startswith(Config.MEMORY_NAME)), None)
+        # Check existing memory (previous deployment info first, then list)
+        memory_id = load_cached_memory_id(memory_client) or find_existing_memory(memory_client)
         
-        if existing_memory:
-            memory_id = existing_memory['id']
-            print(f"✅ Using existing memory: {memory_id}")
+        if memory_id:
+            logger.info("✅ Using existing memory: %s", memory_id)
         else:
             # Create new memory - SUMMARY strategy for long-term automatic summarization
             from bedrock_agentcore.memory.constants import StrategyType
@@ -55,12 +117,12 @@ def deploy_memory():
                 poll_interval=10
             )
             memory_id = memory['id']
-            print(f"✅ New memory created: {memory_id}")
+            logger.info("✅ New memory created: %s", memory_id)
         
         return memory_id
         
     except Exception as e:
-        print(f"❌ Memory creation failed: {e}")
+        logger.error("❌ Memory creation failed: %s", e)
         raise
 
 def save_deployment_info(memory_id):
@@ -73,14 +135,18 @@ def save_deployment_info(memory_id):
     }
     
     info_file = Path(__file__).parent / "deployment_info.json"
-    with open(info_file, 'w') as f:
-        json.dump(deployment_info, f, indent=2)
+    data = json_utils.json_dumps_indented(deployment_info)
+    
+    # Write to temporary file and atomically replace, so an interrupted write never leaves a truncated file
+    tmp_file = info_file.with_suffix(".json.tmp")
+    tmp_file.write_bytes(data)
+    os.replace(tmp_file, info_file)
     
     return str(info_file)
 
 def main():
     try:
-        print("🧠 AgentCore Memory Deployment Started")
+        logger.info("🧠 AgentCore Memory Deployment Started")
         
         # Create Memory
         memory_id = deploy_memory()
@@ -88,14 +154,14 @@ def main():
         # Save deployment information
         info_file = save_deployment_info(memory_id)
         
-        print(f"\n🎉 Deployment Complete!")
-        print(f"📄 Deployment Info: {info_file}")
-        print(f"🧠 Memory ID: {memory_id}")
+        logger.info("\n🎉 Deployment Complete!")
+        logger.info("📄 Deployment Info: %s", info_file)
+        logger.info("🧠 Memory ID: %s", memory_id)
         
         return 0
         
     except Exception as e:
-        print(f"❌ Deployment Failed: {e}")
+        logger.error("❌ Deployment Failed: %s", e)
         return 1
 
 if __name__ == "__main__":
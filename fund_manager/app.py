@@ -7,14 +7,22 @@ AI Fund Manager Web Interface
 
 import streamlit as st
 import os
+import html
 import json
-import boto3
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
+import time
+import functools
+import re
+import sys
 from datetime import datetime
 from pathlib import Path
-from bedrock_agentcore.memory import MemoryClient
+
+# Shared modules live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.chart_utils import distribution_bar_texts
+from shared.json_utils import json_loads
+from shared.stream_utils import iter_sse_data
+
+# boto3, plotly, pandas and numpy are imported where used, so a cold start only loads what the selected menu needs
 
 st.set_page_config(
     page_title="🤖 Agentic AI Fund Manager",
@@ -44,8 +52,9 @@ if st.sidebar.button("🔄 Start New Session"):
     st.rerun()
 
 # Load deployment information (environment variables first, then local JSON files)
+@st.cache_resource
 def load_deployment_info():
-    """Load deployment information from environment variables or local JSON files"""
+    """Load deployment information from environment variables or local JSON files (read once and reused across reruns)"""
     # Try environment variables first (Docker container environment)
     agent_arn = os.getenv("BWB_FUND_MANAGER_ARN")
     memory_id = os.getenv("BWB_MEMORY_ID") 
@@ -56,27 +65,51 @@ def load_deployment_info():
         return agent_arn, memory_id, region, "static"
     
     # If no environment variables, load from local JSON files (local development environment)
-    try:
-        with open(Path(__file__).parent / "deployment_info.json") as f:
-            deployment_info = json.load(f)
-        agent_arn = deployment_info["agent_arn"]
-        region = deployment_info["region"]
-        
-        with open(Path(__file__).parent / "agentcore_memory" / "deployment_info.json") as f:
-            memory_info = json.load(f)
-        memory_id = memory_info["memory_id"]
-        
-        # Local environment: set static folder path
-        return agent_arn, memory_id, region, "../static"
-        
-    except Exception as e:
-        st.error(f"Deployment information not found. Please set environment variables (FUND_MANAGER_ARN, MEMORY_ID, AWS_REGION) or run deploy.py first. Error: {e}")
-        st.stop()
+    with open(Path(__file__).parent / "deployment_info.json") as f:
+        deployment_info = json.load(f)
+    agent_arn = deployment_info["agent_arn"]
+    region = deployment_info["region"]
+    
+    with open(Path(__file__).parent / "agentcore_memory" / "deployment_info.json") as f:
+        memory_info = json.load(f)
+    memory_id = memory_info["memory_id"]
+    
+    # Local environment: set static folder path
+    return agent_arn, memory_id, region, "../static"
+
+try:
+    AGENT_ARN, MEMORY_ID, REGION, STATIC_PATH = load_deployment_info()
+except Exception as e:
+    st.error(f"Deployment information not found. Please set environment variables (FUND_MANAGER_ARN, MEMORY_ID, AWS_REGION) or run deploy.py first. Error: {e}")
+    st.stop()
+
+@st.cache_resource
+def get_clients(region):
+    """Create AgentCore and Memory clients shared across Streamlit reruns and sessions"""
+    import boto3
+    from bedrock_agentcore.memory import MemoryClient
+    
+    return boto3.client('bedrock-agentcore', region_name=region), MemoryClient(region_name=region)
+
+agentcore_client, memory_client = get_clients(REGION)
+
+# Streaming text is re-rendered at most every RENDER_INTERVAL seconds or RENDER_CHARS new characters
+RENDER_INTERVAL = 0.1
+RENDER_CHARS = 256
+
+@functools.lru_cache(maxsize=128)
+def loads_cached(text):
+    """Parse JSON text once per distinct payload (parsed results are shared, treat as read-only)"""
+    return json_loads(text)
 
-AGENT_ARN, MEMORY_ID, REGION, STATIC_PATH = load_deployment_info()
+# Correlation matrices with more tickers than this are drawn without per-cell text
+CORRELATION_TEXT_MAX = 10
 
-agentcore_client = boto3.client('bedrock-agentcore', region_name=REGION)
-memory_client = MemoryClient(region_name=REGION)
+# Plotly chart options for result figures (no hover mode bar)
+CHART_CONFIG = {'displayModeBar': False}
+
+# Response stream read size (bytes)
+STREAM_CHUNK_SIZE = 65536
 
 def display_calculator_result(container, tool_input, result_text):
     """Display Calculator tool results"""
@@ -85,6 +118,9 @@ def display_calculator_result(container, tool_input, result_text):
 
 def display_etf_analysis_result(container, etf_data):
     """Display individual ETF analysis results"""
+    import numpy as np
+    import plotly.graph_objects as go
+    
     try:
         container.markdown(f"**📊 {etf_data['ticker']} Analysis Results (Monte Carlo Simulation)**")
         
@@ -102,61 +138,95 @@ def display_etf_analysis_result(container, etf_data):
         if 'return_distribution' in etf_data:
             distribution = etf_data['return_distribution']
             ranges = list(distribution.keys())
-            counts = list(distribution.values())
+            # int32 counts keep the serialized figure payload small
+            counts = np.asarray(list(distribution.values()), dtype=np.int32)
             
-            fig = go.Figure(data=[go.Bar(
-                x=ranges,
-                y=counts,
-                text=[f"{count} times<br>({count/5:.1f}%)" for count in counts],
-                textposition='auto',
-                marker_color='lightblue',
-                name=etf_data['ticker']
-            )])
+            ticker = etf_data['ticker']
+            fig = go.Figure(data=[
+                go.Bar(
+                    x=ranges,
+                    y=counts,
+                    text=distribution_bar_texts(counts),
+                    textposition='auto',
+                    marker_color='lightblue',
+                    name=ticker
+                )
+            ])
             
+            # uirevision keeps zoom/pan state across reruns for the same ticker
             fig.update_layout(
                 title=f"Expected Return Distribution After 1 Year (1000 Simulations)",
                 xaxis_title="Return Range",
                 yaxis_title="Number of Scenarios",
                 height=400,
-                showlegend=False
+                showlegend=False,
+                uirevision=ticker,
+                template=None
             )
             
-            container.plotly_chart(fig, width='stretch')
+            container.plotly_chart(fig, width='stretch', theme=None)
         
     except Exception as e:
         container.error(f"ETF analysis result display error: {e}")
 
+@st.cache_data
+def build_correlation_frame(correlation_matrix):
+    """Build correlation DataFrame (identical matrices across reruns reuse the cached frame)"""
+    import pandas as pd
+    
+    return pd.DataFrame(correlation_matrix)
+
 def display_correlation_analysis(container, correlation_data):
     """Display correlation analysis results"""
+    import numpy as np
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
     try:
         container.markdown("**🔗 ETF Correlation Matrix**")
         
         correlation_matrix = correlation_data.get('correlation_matrix', {})
         
         if correlation_matrix:
-            df = pd.DataFrame(correlation_matrix)
+            df = build_correlation_frame(correlation_matrix)
+            # float32 values halve the serialized figure payload
+            values = df.values.astype(np.float32)
             
-            fig = px.imshow(
-                df.values,
-                x=df.columns,
-                y=df.index,
-                color_continuous_scale='RdBu_r',
-                aspect="auto",
-                text_auto=True,
-                color_continuous_midpoint=0,
-                zmin=-1,
-                zmax=1
-            )
+            if df.shape[0] > CORRELATION_TEXT_MAX:
+                # Large matrix: plain heatmap without per-cell text annotations
+                fig = go.Figure(data=[go.Heatmap(
+                    z=values,
+                    x=list(df.columns),
+                    y=list(df.index),
+                    colorscale='RdBu_r',
+                    zmid=0,
+                    zmin=-1,
+                    zmax=1
+                )])
+            else:
+                fig = px.imshow(
+                    values,
+                    x=df.columns,
+                    y=df.index,
+                    color_continuous_scale='RdBu_r',
+                    aspect="auto",
+                    text_auto=True,
+                    color_continuous_midpoint=0,
+                    zmin=-1,
+                    zmax=1
+                )
+                fig.update_traces(texttemplate="%{z:.2f}", textfont_size=12)
             
             fig.update_layout(
                 title="ETF Correlation Matrix",
                 height=400,
                 xaxis_title="ETF",
-                yaxis_title="ETF"
+                yaxis_title="ETF",
+                uirevision="correlation",
+                template=None
             )
             
-            fig.update_traces(texttemplate="%{z:.2f}", textfont_size=12)
-            container.plotly_chart(fig, width='stretch')
+            container.plotly_chart(fig, width='stretch', theme=None)
             
             container.markdown("**Correlation Interpretation**")
             container.info("""
@@ -168,11 +238,15 @@ def display_correlation_analysis(container, correlation_data):
     except Exception as e:
         container.error(f"Correlation analysis display error: {e}")
 
+NEWS_COLUMNS = ('publish_date', 'title', 'summary')
+
 def display_news_data(container, news_data):
     """Display ETF news data"""
+    import pandas as pd
+    
     try:
         if isinstance(news_data, str):
-            data = json.loads(news_data)
+            data = loads_cached(news_data)
         else:
             data = news_data
         
@@ -185,10 +259,15 @@ def display_news_data(container, news_data):
         
         container.markdown(f"**📰 {ticker} Latest News**")
         
-        news_df = pd.DataFrame(news_list)
-        if not news_df.empty and all(col in news_df.columns for col in ['publish_date', 'title', 'summary']):
+        # Table when the first item has all displayed fields, otherwise go straight to the expander list
+        if all(col in news_list[0] for col in NEWS_COLUMNS):
+            # Build only the displayed columns in one shot (no full frame to slice)
+            news_df = pd.DataFrame(
+                {col: [news_item.get(col) for news_item in news_list] for col in NEWS_COLUMNS},
+                copy=False
+            )
             container.dataframe(
-                news_df[['publish_date', 'title', 'summary']],
+                news_df,
                 hide_index=True,
                 width="stretch"
             )
@@ -201,65 +280,48 @@ def display_news_data(container, news_data):
     except Exception as e:
         container.error(f"News data display error: {str(e)}")
 
-def display_market_data(container, market_data):
-    """Display macroeconomic indicator data"""
+@st.cache_data(ttl=60)
+def build_indicator_table(data):
+    """Build indicator table (identical payloads across reruns reuse the cached frame)"""
+    import pandas as pd
+    
+    rows = [
+        (info.get('description', key), f"{info['value']}")
+        if isinstance(info, dict) and 'value' in info
+        else (key, "No data available")
+        for key, info in data.items()
+        if not key.startswith('_')
+    ]
+    return pd.DataFrame(rows, columns=['Indicator', 'Value'])
+
+# Indicator tool -> (header, error label)
+INDICATOR_DISPLAYS = {
+    "get_market_data": ("**📊 Key Macroeconomic Indicators**", "Market data"),
+    "get_geopolitical_indicators": ("**🌍 Major Regional ETFs (Geopolitical Risk)**", "Geopolitical data")
+}
+
+def display_indicator_grid(container, indicator_data, title, error_label):
+    """Display macroeconomic or geopolitical indicator data as a single table"""
     try:
-        if isinstance(market_data, str):
-            data = json.loads(market_data)
+        if isinstance(indicator_data, str):
+            data = loads_cached(indicator_data)
         else:
-            data = market_data
-        
-        container.markdown("**📊 Key Macroeconomic Indicators**")
-        
-        indicators = {k: v for k, v in data.items() if not k.startswith('_')}
-        
-        indicator_items = list(indicators.items())
-        for i in range(0, len(indicator_items), 3):
-            cols = container.columns(3)
-            for j, (key, info) in enumerate(indicator_items[i:i+3]):
-                if j < len(cols):
-                    with cols[j]:
-                        if isinstance(info, dict) and 'value' in info:
-                            description = info.get('description', key)
-                            value = info['value']
-                            st.metric(description, f"{value}")
-                        else:
-                            st.write(f"**{key}**: No data available")
-                
+            data = indicator_data
+        
+        container.markdown(title)
+        container.dataframe(
+            build_indicator_table(data),
+            hide_index=True,
+            width="stretch"
+        )
     except Exception as e:
-        container.error(f"Market data display error: {str(e)}")
+        container.error(f"{error_label} display error: {str(e)}")
 
-def display_geopolitical_data(container, geopolitical_data):
-    """Display geopolitical risk indicator data"""
-    try:
-        if isinstance(geopolitical_data, str):
-            data = json.loads(geopolitical_data)
-        else:
-            data = geopolitical_data
-        
-        container.markdown("**🌍 Major Regional ETFs (Geopolitical Risk)**")
-        
-        indicators = {k: v for k, v in data.items() if not k.startswith('_')}
-        
-        indicator_items = list(indicators.items())
-        for i in range(0, len(indicator_items), 3):
-            cols = container.columns(3)
-            for j, (key, info) in enumerate(indicator_items[i:i+3]):
-                if j < len(cols):
-                    with cols[j]:
-                        if isinstance(info, dict) and 'value' in info:
-                            description = info.get('description', key)
-                            value = info['value']
-                            st.metric(description, f"{value}")
-                        else:
-                            st.write(f"**{key}**: No data available")
-                
-    except Exception as e:
-        container.error(f"Geopolitical data display error: {str(e)}")
+SECTOR_TAG_TEMPLATE = '<span style="background-color: #e1f5fe; color: #01579b; padding: 4px 8px; margin: 2px; border-radius: 12px; font-size: 12px; display: inline-block;">{}</span> '
 
 def display_financial_analysis(container, analysis_content):
     """Display financial analysis results"""
-    data = json.loads(analysis_content)
+    data = loads_cached(analysis_content)
     
     container.markdown("**Overall Assessment**")
     container.info(data.get("summary", ""))
@@ -277,15 +339,58 @@ def display_financial_analysis(container, analysis_content):
         # Display recommended fund investment sectors as tags
         st.markdown("**🎯 Recommended Fund Investment Sectors**")
         sectors = data.get("key_sectors", [])
-        tag_html = ""
-        for sector in sectors:
-            tag_html += f'<span style="background-color: #e1f5fe; color: #01579b; padding: 4px 8px; margin: 2px; border-radius: 12px; font-size: 12px; display: inline-block;">{sector}</span> '
+        tag_html = "".join(SECTOR_TAG_TEMPLATE.format(sector) for sector in sectors)
         st.markdown(tag_html, unsafe_allow_html=True)
 
+# Portfolio score key -> display label
+PORTFOLIO_SCORES = (
+    ("profitability", "Profitability"),
+    ("risk_management", "Risk Management"),
+    ("diversification", "Diversification")
+)
+SCORE_GRID_TEMPLATE = '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 8px;">{}</div>'
+SCORE_CARD_TEMPLATE = (
+    '<div>'
+    '<div style="font-size: 14px;">{label}</div>'
+    '<div style="font-size: 36px; line-height: 1.4;">{score}/10</div>'
+    '<div style="font-size: 14px; color: rgba(49, 51, 63, 0.6);">{reason}</div>'
+    '</div>'
+)
+
+def allocation_pie(allocation, **layout):
+    """Build allocation pie chart"""
+    import plotly.graph_objects as go
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=list(allocation.keys()),
+        values=list(allocation.values()),
+        hole=.3,
+        textinfo='label+percent'
+    )])
+    fig.update_layout(height=400, **layout)
+    return fig
+
+@st.cache_data(max_entries=32)
+def build_portfolio_figure(portfolio_content):
+    """Build portfolio allocation figure (cached by raw JSON payload)"""
+    data = loads_cached(portfolio_content)
+    return allocation_pie(data["portfolio_allocation"], uirevision="portfolio")
+
+@st.cache_data(max_entries=32)
+def build_scenario_figures(analysis_content):
+    """Build adjusted allocation figure per scenario (cached by raw JSON payload)"""
+    data = loads_cached(analysis_content)
+    figures = {}
+    for i, scenario_key in enumerate(["scenario1", "scenario2"], 1):
+        allocation = data.get(scenario_key, {}).get('allocation_management', {})
+        if allocation:
+            figures[scenario_key] = allocation_pie(allocation, title=f"Scenario {i} Portfolio", uirevision=scenario_key)
+    return figures
+
 def display_portfolio_result(container, portfolio_content):
     """Display portfolio design results"""
     try:
-        data = json.loads(portfolio_content)
+        data = loads_cached(portfolio_content)
         if not data:
             container.error("Portfolio data not found.")
             return
@@ -294,14 +399,8 @@ def display_portfolio_result(container, portfolio_content):
         
         with col1:
             st.markdown("**Portfolio Allocation**")
-            fig = go.Figure(data=[go.Pie(
-                labels=list(data["portfolio_allocation"].keys()),
-                values=list(data["portfolio_allocation"].values()),
-                hole=.3,
-                textinfo='label+percent'
-            )])
-            fig.update_layout(height=400)
-            st.plotly_chart(fig)
+            fig = build_portfolio_figure(portfolio_content)
+            st.plotly_chart(fig, theme=None, config=CHART_CONFIG)
         
         with col2:
             st.markdown("**Portfolio Composition Rationale**")
@@ -311,24 +410,16 @@ def display_portfolio_result(container, portfolio_content):
             container.markdown("**Portfolio Evaluation Scores**")
             scores = data["portfolio_scores"]
             
-            col1, col2, col3 = container.columns(3)
-            with col1:
-                profitability = scores.get("profitability", {})
-                st.metric("Profitability", f"{profitability.get('score', 'N/A')}/10")
-                if profitability.get('reason'):
-                    st.caption(profitability['reason'])
-            
-            with col2:
-                risk_mgmt = scores.get("risk_management", {})
-                st.metric("Risk Management", f"{risk_mgmt.get('score', 'N/A')}/10")
-                if risk_mgmt.get('reason'):
-                    st.caption(risk_mgmt['reason'])
-            
-            with col3:
-                diversification = scores.get("diversification", {})
-                st.metric("Diversification", f"{diversification.get('score', 'N/A')}/10")
-                if diversification.get('reason'):
-                    st.caption(diversification['reason'])
+            # One HTML grid instead of columns + a metric/caption element per score
+            cards = "".join(
+                SCORE_CARD_TEMPLATE.format(
+                    label=label,
+                    score=html.escape(str(scores.get(key, {}).get('score', 'N/A'))),
+                    reason=html.escape(scores.get(key, {}).get('reason') or "")
+                )
+                for key, label in PORTFOLIO_SCORES
+            )
+            container.markdown(SCORE_GRID_TEMPLATE.format(cards), unsafe_allow_html=True)
         
     except Exception as e:
         container.error(f"Portfolio display error: {str(e)}")
@@ -336,11 +427,13 @@ def display_portfolio_result(container, portfolio_content):
 def display_risk_analysis_result(container, analysis_content):
     """Display risk analysis results"""
     try:
-        data = json.loads(analysis_content)
+        data = loads_cached(analysis_content)
         if not data:
             container.error("Risk analysis data not found.")
             return
         
+        scenario_figures = build_scenario_figures(analysis_content)
+        
         for i, scenario_key in enumerate(["scenario1", "scenario2"], 1):
             if scenario_key in data:
                 scenario = data[scenario_key]
@@ -360,16 +453,9 @@ def display_risk_analysis_result(container, analysis_content):
                 
                 with col1:
                     st.markdown("**Adjusted Portfolio Allocation**")
-                    allocation = scenario.get('allocation_management', {})
-                    if allocation:
-                        fig = go.Figure(data=[go.Pie(
-                            labels=list(allocation.keys()),
-                            values=list(allocation.values()),
-                            hole=.3,
-                            textinfo='label+percent'
-                        )])
-                        fig.update_layout(height=400, title=f"Scenario {i} Portfolio")
-                        st.plotly_chart(fig, width='stretch')
+                    fig = scenario_figures.get(scenario_key)
+                    if fig:
+                        st.plotly_chart(fig, width='stretch', theme=None, config=CHART_CONFIG)
                 
                 with col2:
                     st.markdown("**Adjustment Reasoning and Strategy**")
@@ -379,6 +465,14 @@ def display_risk_analysis_result(container, analysis_content):
     except Exception as e:
         container.error(f"Risk analysis display error: {str(e)}")
 
+def render_thinking(text_placeholder, chunks):
+    """Render accumulated streaming text"""
+    text = "".join(chunks)
+    if text.strip():
+        # Display in chat format inside expander
+        with text_placeholder.chat_message("assistant"):
+            st.markdown(text)
+
 def invoke_fund_manager(input_data, session_id):
     """Invoke Fund Manager - Pass session ID"""
     try:
@@ -401,132 +495,143 @@ def invoke_fund_manager(input_data, session_id):
         agent_containers = {}
         agent_thinking_containers = {}
         current_thinking = {}
+        pending_chars = {}
+        last_flush_ts = {}
         current_text_placeholders = {}
         tool_id_to_name = {}
         tool_id_to_input = {}
         
-        for line in response["response"].iter_lines(chunk_size=1):
-            if line and line.decode("utf-8").startswith("data: "):
-                try:
-                    event_data = json.loads(line.decode("utf-8")[6:])
-                    event_type = event_data.get("type")
+        for payload in iter_sse_data(response["response"], STREAM_CHUNK_SIZE):
+            try:
+                event_data = json_loads(payload)
+                event_type = event_data.get("type")
+                
+                # Flush coalesced text before handling any other event
+                if event_type != "text_chunk" and pending_chars.get(current_agent):
+                    render_thinking(current_text_placeholders[current_agent], current_thinking[current_agent])
+                    pending_chars[current_agent] = 0
+                
+                if event_type == "text_chunk":
+                    chunk_data = event_data.get("data", "")
+                    if current_agent and current_agent in current_thinking:
+                        current_thinking[current_agent].append(chunk_data)
+                        pending_chars[current_agent] += len(chunk_data)
+                        now = time.monotonic()
+                        if now - last_flush_ts[current_agent] >= RENDER_INTERVAL or pending_chars[current_agent] >= RENDER_CHARS:
+                            render_thinking(current_text_placeholders[current_agent], current_thinking[current_agent])
+                            pending_chars[current_agent] = 0
+                            last_flush_ts[current_agent] = now
+                
+                elif event_type == "tool_use":
+                    tool_name = event_data.get("tool_name", "")
+                    tool_use_id = event_data.get("tool_use_id", "")
+                    tool_input = event_data.get("tool_input", "")
                     
-                    if event_type == "text_chunk":
-                        chunk_data = event_data.get("data", "")
-                        if current_agent and current_agent in current_thinking:
-                            current_thinking[current_agent] += chunk_data
-                            if current_thinking[current_agent].strip() and current_agent in current_text_placeholders:
-                                # Display in chat format inside expander
-                                with current_text_placeholders[current_agent].chat_message("assistant"):
-                                    st.markdown(current_thinking[current_agent])
+                    actual_tool_name = tool_name.rpartition("___")[2]
+                    tool_id_to_name[tool_use_id] = actual_tool_name
+                    tool_id_to_input[tool_use_id] = tool_input
+                
+                elif event_type == "tool_result":
+                    tool_use_id = event_data.get("tool_use_id", "")
+                    actual_tool_name = tool_id_to_name.get(tool_use_id, "unknown")
+                    tool_input = tool_id_to_input.get(tool_use_id, "unknown")
+                    tool_content = event_data.get("content", [{}])
                     
-                    elif event_type == "tool_use":
-                        tool_name = event_data.get("tool_name", "")
-                        tool_use_id = event_data.get("tool_use_id", "")
-                        tool_input = event_data.get("tool_input", "")
+                    if tool_content and len(tool_content) > 0 and current_agent in agent_thinking_containers:
+                        result_text = tool_content[0].get("text", "{}")
+                        container = agent_thinking_containers[current_agent]
                         
-                        actual_tool_name = tool_name.split("___")[-1] if "___" in tool_name else tool_name
-                        tool_id_to_name[tool_use_id] = actual_tool_name
-                        tool_id_to_input[tool_use_id] = tool_input
+                        if current_agent == "financial" and actual_tool_name == "calculator":
+                            display_calculator_result(container, tool_input, result_text)
+                        elif current_agent == "portfolio":
+                            try:
+                                body = loads_cached(result_text)
+                                if actual_tool_name == "analyze_etf_performance":
+                                    display_etf_analysis_result(container, body)
+                                elif actual_tool_name == "calculate_correlation":
+                                    display_correlation_analysis(container, body)
+                            except:
+                                pass
+                        elif current_agent == "risk":
+                            try:
+                                parsed_result = loads_cached(result_text)
+                                if "statusCode" in parsed_result and "body" in parsed_result:
+                                    body = parsed_result["body"]
+                                    if isinstance(body, str):
+                                        body = loads_cached(body)
+                                else:
+                                    body = parsed_result
+                                
+                                if actual_tool_name == "get_product_news":
+                                    display_news_data(container, body)
+                                elif actual_tool_name in INDICATOR_DISPLAYS:
+                                    display_indicator_grid(container, body, *INDICATOR_DISPLAYS[actual_tool_name])
+                            except:
+                                pass
                     
-                    elif event_type == "tool_result":
-                        tool_use_id = event_data.get("tool_use_id", "")
-                        actual_tool_name = tool_id_to_name.get(tool_use_id, "unknown")
-                        tool_input = tool_id_to_input.get(tool_use_id, "unknown")
-                        tool_content = event_data.get("content", [{}])
-                        
-                        if tool_content and len(tool_content) > 0 and current_agent in agent_thinking_containers:
-                            result_text = tool_content[0].get("text", "{}")
-                            container = agent_thinking_containers[current_agent]
-                            
-                            if current_agent == "financial" and actual_tool_name == "calculator":
-                                display_calculator_result(container, tool_input, result_text)
-                            elif current_agent == "portfolio":
-                                try:
-                                    body = json.loads(result_text)
-                                    if actual_tool_name == "analyze_etf_performance":
-                                        display_etf_analysis_result(container, body)
-                                    elif actual_tool_name == "calculate_correlation":
-                                        display_correlation_analysis(container, body)
-                                except:
-                                    pass
-                            elif current_agent == "risk":
-                                try:
-                                    parsed_result = json.loads(result_text)
-                                    if "statusCode" in parsed_result and "body" in parsed_result:
-                                        body = parsed_result["body"]
-                                        if isinstance(body, str):
-                                            body = json.loads(body)
-                                    else:
-                                        body = parsed_result
-                                    
-                                    if actual_tool_name == "get_product_news":
-                                        display_news_data(container, body)
-                                    elif actual_tool_name == "get_market_data":
-                                        display_market_data(container, body)
-                                    elif actual_tool_name == "get_geopolitical_indicators":
-                                        display_geopolitical_data(container, body)
-                                except:
-                                    pass
-                        
-                        if current_agent:
-                            current_thinking[current_agent] = ""
-                            if tool_use_id in tool_id_to_name:
-                                del tool_id_to_name[tool_use_id]
-                            if tool_use_id in tool_id_to_input:
-                                del tool_id_to_input[tool_use_id]
-                            if current_agent in current_text_placeholders:
-                                current_text_placeholders[current_agent] = agent_thinking_containers[current_agent].empty()
+                    if current_agent:
+                        current_thinking[current_agent] = []
+                        if tool_use_id in tool_id_to_name:
+                            del tool_id_to_name[tool_use_id]
+                        if tool_use_id in tool_id_to_input:
+                            del tool_id_to_input[tool_use_id]
+                        if current_agent in current_text_placeholders:
+                            current_text_placeholders[current_agent] = agent_thinking_containers[current_agent].empty()
+                
+                elif event_type == "node_start":
+                    agent_name = event_data.get("agent_name")
+                    current_agent = agent_name
                     
-                    elif event_type == "node_start":
-                        agent_name = event_data.get("agent_name")
-                        current_agent = agent_name
-                        
-                        agent_display_names = {
-                            "financial": "Financial Analyst",
-                            "portfolio": "Portfolio Architect", 
-                            "risk": "Risk Manager"
-                        }
-                        
-                        agent_containers[agent_name] = results_container.container()
-                        
-                        # Wrap reasoning process in expander
-                        thinking_expander = agent_containers[agent_name].expander(f"🧠 {agent_display_names.get(agent_name, agent_name)} Reasoning", expanded=True)
-                        agent_thinking_containers[agent_name] = thinking_expander.container()
-                        
-                        current_thinking[agent_name] = ""
-                        current_text_placeholders[agent_name] = agent_thinking_containers[agent_name].empty()
-                        
-                    elif event_type == "node_complete":
-                        agent_name = event_data.get("agent_name")
-                        result = event_data.get("result")
+                    agent_display_names = {
+                        "financial": "Financial Analyst",
+                        "portfolio": "Portfolio Architect", 
+                        "risk": "Risk Manager"
+                    }
+                    
+                    agent_containers[agent_name] = results_container.container()
+                    
+                    # Wrap reasoning process in expander
+                    thinking_expander = agent_containers[agent_name].expander(f"🧠 {agent_display_names.get(agent_name, agent_name)} Reasoning", expanded=True)
+                    agent_thinking_containers[agent_name] = thinking_expander.container()
+                    
+                    current_thinking[agent_name] = []
+                    pending_chars[agent_name] = 0
+                    last_flush_ts[agent_name] = 0.0
+                    current_text_placeholders[agent_name] = agent_thinking_containers[agent_name].empty()
+                    
+                elif event_type == "node_complete":
+                    agent_name = event_data.get("agent_name")
+                    result = event_data.get("result")
+                    
+                    if agent_name in agent_containers and result:
+                        container = agent_containers[agent_name]
                         
-                        if agent_name in agent_containers and result:
-                            container = agent_containers[agent_name]
+                        # Display final results outside expander (main area)
+                        if agent_name == "financial":
+                            container.subheader("📌 Financial Analysis Results")
+                            display_financial_analysis(container, result)
+                            container.divider()
                             
-                            # Display final results outside expander (main area)
-                            if agent_name == "financial":
-                                container.subheader("📌 Financial Analysis Results")
-                                display_financial_analysis(container, result)
-                                container.divider()
-                                
-                            elif agent_name == "portfolio":
-                                container.subheader("📌 Portfolio Design Results")
-                                display_portfolio_result(container, result)
-                                container.divider()
-                                
-                            elif agent_name == "risk":
-                                container.subheader("📌 Risk Analysis and Scenario Planning")
-                                display_risk_analysis_result(container, result)
-                                container.divider()
-                        
+                        elif agent_name == "portfolio":
+                            container.subheader("📌 Portfolio Design Results")
+                            display_portfolio_result(container, result)
+                            container.divider()
+                            
+                        elif agent_name == "risk":
+                            container.subheader("📌 Risk Analysis and Scenario Planning")
+                            display_risk_analysis_result(container, result)
+                            container.divider()
+                    
 
 
-                    elif event_type == "error":
-                        return {"status": "error", "error": event_data.get("error", "Unknown error")}
-                        
-                except json.JSONDecodeError:
-                    continue
+                elif event_type == "error":
+                    return {"status": "error", "error": event_data.get("error", "Unknown error")}
+                    
+            except json.JSONDecodeError:
+                continue
+        
+        if pending_chars.get(current_agent):
+            render_thinking(current_text_placeholders[current_agent], current_thinking[current_agent])
         
         # Display analysis completion message at the bottom of results_container
         with results_container:
@@ -538,18 +643,19 @@ def invoke_fund_manager(input_data, session_id):
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
-def load_current_session_summary():
+@st.cache_data(ttl=30)
+def fetch_session_summary(memory_id, session_id):
+    """Query session's SUMMARY strategy results (cached briefly so menu switches skip the round-trip)"""
+    return memory_client.retrieve_memories(
+        memory_id=memory_id,
+        namespace=f"fund/session/{session_id}",
+        query="fund management summary"
+    )
+
+def load_current_session_summary(current_session):
     """Load current session's Long-term Memory summary"""
     try:
-        # Query current session's SUMMARY strategy results
-        current_session = st.session_state.current_session_id
-        session_namespace = f"fund/session/{current_session}"
-        
-        response = memory_client.retrieve_memories(
-            memory_id=MEMORY_ID,
-            namespace=session_namespace,
-            query="fund management summary"
-        )
+        response = fetch_session_summary(MEMORY_ID, current_session)
         
         if response and len(response) > 0:
             # Return the latest summary
@@ -576,13 +682,94 @@ def load_current_session_summary():
             }
         
     except Exception as e:
-        st.error(f"Current session Memory query failed: {e}")
         return {
-            'session_id': st.session_state.current_session_id,
+            'session_id': current_session,
             'found': False,
             'error': str(e)
         }
 
+def format_timestamp(timestamp):
+    """Format ISO timestamp for display"""
+    if not (isinstance(timestamp, str) and 'T' in timestamp):
+        return str(timestamp)
+    try:
+        # Python 3.11+ parses the 'Z' suffix natively
+        if sys.version_info < (3, 11):
+            timestamp = timestamp.replace('Z', '+00:00')
+        return datetime.fromisoformat(timestamp).strftime('%Y-%m-%d %H:%M:%S')
+    except ValueError:
+        return str(timestamp)
+
+def run_analysis(input_data, session_id):
+    """Run fund management analysis and stream results into the page"""
+    st.divider()
+    with st.spinner("AI Analysis in Progress..."):
+        result = invoke_fund_manager(
+            input_data, 
+            session_id
+        )
+        
+        if result['status'] == 'error':
+            st.error(f"❌ Analysis error: {result.get('error', 'Unknown error')}")
+
+@st.fragment
+def render_history(session_id):
+    """Render current session summary (fragment: refresh reruns only this section)"""
+    st.markdown("### 📚 Current Session Fund Management Summary")
+    st.info(f"You can check the automatic summary of current session **{session_id}** using AgentCore SUMMARY strategy.")
+    
+    if st.button("🔄 Refresh Summary", width='stretch'):
+        fetch_session_summary.clear()
+        st.rerun(scope="fragment")
+    
+    with st.spinner("Loading current session's Long-term Memory..."):
+        summary_data = load_current_session_summary(session_id)
+    
+    if not summary_data['found']:
+        if 'error' in summary_data:
+            st.error(f"Error occurred while querying summary: {summary_data['error']}")
+        else:
+            st.warning("Fund management summary for the current session has not been generated yet.")
+            st.markdown("""
+            **Summary Generation Conditions:**
+            - Fund management consultation must be completed (all 3 agents executed)
+            - AgentCore SUMMARY strategy automatically generates summaries
+            - Summary generation may take a few minutes
+            """)
+    else:
+        # Format time display for better readability
+        time_display = format_timestamp(summary_data['timestamp'])
+        
+        # Loader already returns text; str() is a no-op for str
+        content = str(summary_data['content'])
+        
+        st.markdown("## 📋 Fund Management Consultation Summary")
+        st.caption(f"🕒 {time_display}")
+        
+        # Simple processing of XML-format summary: extract and display topics
+        topics = TOPIC_PATTERN.findall(content)
+        
+        if topics:
+            for topic_name, topic_content in topics:
+                st.subheader(f"📌 {topic_name}")
+                # HTML entity decoding (all named and numeric entities)
+                st.write(html.unescape(topic_content).strip())
+                st.divider()
+        else:
+            # Display original content if XML parsing fails
+            st.text(content)
+
+# Summary topic blocks produced by the SUMMARY strategy
+TOPIC_PATTERN = re.compile(r'<topic name="([^"]+)">\s*(.*?)\s*</topic>', re.DOTALL)
+
+# Investor input options (shared by the form and the submit handler)
+AGE_OPTIONS = tuple(f"{i}-{i+4} years old" for i in range(20, 101, 5))
+EXPERIENCE_MAPPING = {
+    "0-1 years": 1, "1-3 years": 2, "3-5 years": 4, 
+    "5-10 years": 7, "10-20 years": 15, "20+ years": 25
+}
+EXPERIENCE_CATEGORIES = tuple(EXPERIENCE_MAPPING)
+
 # UI configuration by menu
 if menu == "🤖 New Fund Management":
     with st.expander("🏗️ Fund Manager Architecture", expanded=True):
@@ -618,18 +805,16 @@ if menu == "🤖 New Fund Management":
     col3, col4, col5 = st.columns(3)
 
     with col3:
-        age_options = [f"{i}-{i+4} years old" for i in range(20, 101, 5)]
         age = st.selectbox(
             "Age",
-            options=age_options,
+            options=AGE_OPTIONS,
             index=3
         )
 
     with col4:
-        experience_categories = ["0-1 years", "1-3 years", "3-5 years", "5-10 years", "10-20 years", "20+ years"]
         stock_investment_experience_years = st.selectbox(
             "Stock Investment Experience",
-            options=experience_categories,
+            options=EXPERIENCE_CATEGORIES,
             index=3
         )
 
@@ -664,11 +849,7 @@ if menu == "🤖 New Fund Management":
         
         age_number = int(age.split('-')[0]) + 2
         
-        experience_mapping = {
-            "0-1 years": 1, "1-3 years": 2, "3-5 years": 4, 
-            "5-10 years": 7, "10-20 years": 15, "20+ years": 25
-        }
-        experience_years = experience_mapping[stock_investment_experience_years]
+        experience_years = EXPERIENCE_MAPPING[stock_investment_experience_years]
         
         input_data = {
             "total_investable_amount": int(total_investable_amount * 100000000),
@@ -679,70 +860,7 @@ if menu == "🤖 New Fund Management":
             "preferred_sectors": preferred_sectors
         }
         
-        st.divider()
-        with st.spinner("AI Analysis in Progress..."):
-            result = invoke_fund_manager(
-                input_data, 
-                st.session_state.current_session_id
-            )
-            
-            if result['status'] == 'error':
-                st.error(f"❌ Analysis error: {result.get('error', 'Unknown error')}")
+        run_analysis(input_data, st.session_state.current_session_id)
 
 elif menu == "📚 Management History (Long-term Memory)":
-    st.markdown("### 📚 Current Session Fund Management Summary")
-    st.info(f"You can check the automatic summary of current session **{st.session_state.current_session_id}** using AgentCore SUMMARY strategy.")
-    
-    if st.button("🔄 Refresh Summary", width='stretch'):
-        st.rerun()
-    
-    with st.spinner("Loading current session's Long-term Memory..."):
-        summary_data = load_current_session_summary()
-    
-    if not summary_data['found']:
-        if 'error' in summary_data:
-            st.error(f"Error occurred while querying summary: {summary_data['error']}")
-        else:
-            st.warning("Fund management summary for the current session has not been generated yet.")
-            st.markdown("""
-            **Summary Generation Conditions:**
-            - Fund management consultation must be completed (all 3 agents executed)
-            - AgentCore SUMMARY strategy automatically generates summaries
-            - Summary generation may take a few minutes
-            """)
-    else:
-        # Format time display for better readability
-        timestamp = summary_data['timestamp']
-        try:
-            if isinstance(timestamp, str) and 'T' in timestamp:
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                time_display = dt.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                time_display = str(timestamp)
-        except:
-            time_display = str(timestamp)
-        
-        content = summary_data['content']
-        
-        # Simple processing of XML-format summary
-        if isinstance(content, str):
-            st.markdown("## 📋 Fund Management Consultation Summary")
-            
-            # Extract and display topics from XML
-            import re
-            topics = re.findall(r'<topic name="([^"]+)">\s*(.*?)\s*</topic>', content, re.DOTALL)
-            
-            if topics:
-                for topic_name, topic_content in topics:
-                    st.subheader(f"📌 {topic_name}")
-                    # HTML entity decoding
-                    clean_content = topic_content.replace('&quot;', '"').replace('&#39;', "'")
-                    st.write(clean_content.strip())
-                    st.divider()
-            else:
-                # Display original content if XML parsing fails
-                st.text(content)
-        else:
-            # General text processing
-            st.markdown("## 📋 Fund Management Consultation Summary")
-            st.write(content)
+    render_history(st.session_state.current_session_id)
@@ -5,29 +5,42 @@ Fund Manager System Cleanup Script
 Delete and clean up all AWS resources
 """
 
-import json
-import boto3
+import os
 import time
 import sys
+from botocore.config import Config as BotocoreConfig
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
 
+# Add shared module path
+sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
+
+from json_utils import json_loads
+from runtime_utils import get_client, get_session
+
+class Config:
+    """Cleanup Configuration"""
+    IAM_POLICY_WORKERS = int(os.getenv("IAM_POLICY_WORKERS", "16"))  # Concurrent policy delete/detach calls
+    # Adaptive retries absorb IAM throttling when policy calls fan out
+    IAM_CLIENT_CONFIG = BotocoreConfig(retries={"mode": "adaptive", "max_attempts": 10})
+
+def read_json_file(path):
+    """Read JSON file in one binary read, None if missing"""
+    try:
+        with open(path, 'rb') as f:
+            return json_loads(f.read())
+    except FileNotFoundError:
+        return None
+
 def load_deployment_info():
     """Load deployment information"""
     current_dir = Path(__file__).parent
     
     # Fund Manager information
-    advisor_info = None
-    advisor_file = current_dir / "deployment_info.json"
-    if advisor_file.exists():
-        with open(advisor_file) as f:
-            advisor_info = json.load(f)
+    advisor_info = read_json_file(current_dir / "deployment_info.json")
     
     # Memory information
-    memory_info = None
-    memory_file = current_dir / "agentcore_memory" / "deployment_info.json"
-    if memory_file.exists():
-        with open(memory_file) as f:
-            memory_info = json.load(f)
+    memory_info = read_json_file(current_dir / "agentcore_memory" / "deployment_info.json")
     
     return advisor_info, memory_info
 
@@ -35,7 +48,7 @@ def delete_runtime(agent_arn, region):
     """Delete Runtime"""
     try:
         runtime_id = agent_arn.split('/')[-1]
-        client = boto3.client('bedrock-agentcore-control', region_name=region)
+        client = get_client('bedrock-agentcore-control', region)
         client.delete_agent_runtime(agentRuntimeId=runtime_id)
         print(f"✅ Runtime deleted: {runtime_id} (region: {region})")
         return True
@@ -46,7 +59,7 @@ def delete_runtime(agent_arn, region):
 def delete_ecr_repo(repo_name, region):
     """Delete ECR repository"""
     try:
-        ecr = boto3.client('ecr', region_name=region)
+        ecr = get_client('ecr', region)
         ecr.delete_repository(repositoryName=repo_name, force=True)
         print(f"✅ ECR deleted: {repo_name} (region: {region})")
         return True
@@ -57,21 +70,33 @@ def delete_ecr_repo(repo_name, region):
 def delete_iam_role(role_name):
     """Delete IAM role"""
     try:
-        iam = boto3.client('iam')
-        
-        # Delete policies
-        policies = iam.list_role_policies(RoleName=role_name)
-        for policy in policies['PolicyNames']:
-            iam.delete_role_policy(RoleName=role_name, PolicyName=policy)
+        start_time = time.monotonic()
+        iam = get_client('iam', config=Config.IAM_CLIENT_CONFIG)
         
-        # Detach managed policies
-        attached_policies = iam.list_attached_role_policies(RoleName=role_name)
-        for policy in attached_policies['AttachedPolicies']:
-            iam.detach_role_policy(RoleName=role_name, PolicyArn=policy['PolicyArn'])
+        # Delete inline policies and detach managed policies concurrently; each page is
+        # dispatched as soon as it is listed, so removal overlaps with listing the next page
+        with ThreadPoolExecutor(max_workers=Config.IAM_POLICY_WORKERS) as executor:
+            futures = []
+            for page in iam.get_paginator('list_role_policies').paginate(RoleName=role_name):
+                futures.extend(
+                    executor.submit(iam.delete_role_policy, RoleName=role_name, PolicyName=name)
+                    for name in page['PolicyNames']
+                )
+            for page in iam.get_paginator('list_attached_role_policies').paginate(RoleName=role_name):
+                futures.extend(
+                    executor.submit(iam.detach_role_policy, RoleName=role_name, PolicyArn=policy['PolicyArn'])
+                    for policy in page['AttachedPolicies']
+                )
+            # Stop at the first failure: the role can't be deleted while policies remain
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            for future in pending:
+                future.cancel()
+            for future in done:
+                future.result()
         
         # Delete role
         iam.delete_role(RoleName=role_name)
-        print(f"✅ IAM role deleted: {role_name}")
+        print(f"✅ IAM role deleted: {role_name} ({len(futures)} policies, {time.monotonic() - start_time:.1f}s)")
         return True
     except Exception as e:
         print(f"⚠️ IAM role deletion failed {role_name}: {e}")
@@ -81,7 +106,7 @@ def delete_memory(memory_id, region):
     """Delete AgentCore Memory"""
     try:
         from bedrock_agentcore.memory import MemoryClient
-        memory_client = MemoryClient(region_name=region)
+        memory_client = MemoryClient(region_name=region, boto3_session=get_session())
         memory_client.delete_memory(memory_id=memory_id)
         print(f"✅ Memory deleted: {memory_id} (region: {region})")
         return True
@@ -97,15 +122,19 @@ def cleanup_local_files():
         current_dir / "Dockerfile",
         current_dir / ".dockerignore", 
         current_dir / ".bedrock_agentcore.yaml",
+        current_dir / "json_utils.py",
+        current_dir / "stream_utils.py",
         current_dir / "agentcore_memory" / "deployment_info.json",
     ]
     
     deleted_count = 0
     for file_path in files_to_delete:
-        if file_path.exists():
+        try:
             file_path.unlink()
-            print(f"✅ File deleted: {file_path.name}")
-            deleted_count += 1
+        except FileNotFoundError:
+            continue
+        print(f"✅ File deleted: {file_path.name}")
+        deleted_count += 1
     
     if deleted_count > 0:
         print(f"✅ Local file cleanup complete! ({deleted_count} files deleted)")
@@ -130,24 +159,34 @@ def main():
     
     print("\n🗑️ Deleting AWS resources...")
     
-    # 1. Delete Fund Manager Runtime
-    if advisor_info and 'agent_arn' in advisor_info:
-        region = advisor_info.get('region', 'us-west-2')
-        delete_runtime(advisor_info['agent_arn'], region)
-    
-    # 2. Delete ECR repository
-    if advisor_info and 'ecr_repo_name' in advisor_info and advisor_info['ecr_repo_name']:
-        region = advisor_info.get('region', 'us-west-2')
-        delete_ecr_repo(advisor_info['ecr_repo_name'], region)
-    
-    # 3. Delete IAM role
-    if advisor_info and 'iam_role_name' in advisor_info:
-        delete_iam_role(advisor_info['iam_role_name'])
-    
-    # 4. Delete AgentCore Memory
-    if memory_info and 'memory_id' in memory_info:
-        region = memory_info.get('region', 'us-west-2')
-        delete_memory(memory_info['memory_id'], region)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = []
+        
+        # 1. Delete Fund Manager Runtime
+        runtime_future = None
+        if advisor_info and 'agent_arn' in advisor_info:
+            region = advisor_info.get('region', 'us-west-2')
+            runtime_future = executor.submit(delete_runtime, advisor_info['agent_arn'], region)
+            futures.append(runtime_future)
+        
+        # 2. Delete ECR repository (independent of Runtime, runs concurrently)
+        if advisor_info and 'ecr_repo_name' in advisor_info and advisor_info['ecr_repo_name']:
+            region = advisor_info.get('region', 'us-west-2')
+            futures.append(executor.submit(delete_ecr_repo, advisor_info['ecr_repo_name'], region))
+        
+        # 3. Delete AgentCore Memory (independent of Runtime, runs concurrently)
+        if memory_info and 'memory_id' in memory_info:
+            region = memory_info.get('region', 'us-west-2')
+            futures.append(executor.submit(delete_memory, memory_info['memory_id'], region))
+        
+        # 4. Delete IAM role after the Runtime using it is deleted
+        if advisor_info and 'iam_role_name' in advisor_info:
+            if runtime_future:
+                runtime_future.result()
+            futures.append(executor.submit(delete_iam_role, advisor_info['iam_role_name']))
+        
+        for future in as_completed(futures):
+            future.result()
     
     print("\n🎉 AWS resource cleanup complete!")
     
@@ -5,11 +5,11 @@ Fund Manager Deployment Script
 AgentCore Runtime deployment for Fund Manager
 """
 
+import shutil
 import sys
 import time
 import json
 from pathlib import Path
-from bedrock_agentcore_starter_toolkit import Runtime
 
 # Add common configuration and shared module paths
 root_path = Path(__file__).parent.parent
@@ -17,12 +17,15 @@ sys.path.insert(0, str(root_path))
 sys.path.insert(0, str(root_path / "shared"))
 
 from config import Config as GlobalConfig
-from runtime_utils import create_agentcore_runtime_role
+from json_utils import json_dumps_indented, json_loads
+from runtime_utils import create_agentcore_runtime_role, wait_for_runtime_ready
 
 class Config:
     """Fund Manager deployment configuration"""
     REGION = GlobalConfig.REGION
     AGENT_NAME = GlobalConfig.FUND_MANAGER_NAME
+    DEPLOY_TIMEOUT = 900       # seconds
+    STATUS_POLL_INTERVAL = 5   # seconds
 
 def load_agent_arns():
     """Load deployment information of other agents"""
@@ -42,13 +45,16 @@ def load_agent_arns():
     for agent_dir, agent_name in required_agents:
         info_file = base_path / agent_dir / "deployment_info.json"
         
-        if not info_file.exists():
+        # Open directly (a missing file raises, no separate exists() check)
+        try:
+            with open(info_file, 'rb') as f:
+                deployment_info = json_loads(f.read())
+        except FileNotFoundError:
             missing_agents.append(agent_name)
-        else:
-            with open(info_file, 'r') as f:
-                deployment_info = json.load(f)
-                agent_arns[agent_dir] = deployment_info["agent_arn"]
-                print(f"✅ {agent_name}: {deployment_info['agent_arn']}")
+            continue
+        
+        agent_arns[agent_dir] = deployment_info["agent_arn"]
+        print(f"✅ {agent_name}: {deployment_info['agent_arn']}")
     
     if missing_agents:
         raise FileNotFoundError(
@@ -64,17 +70,18 @@ def load_memory_info():
     
     info_file = Path(__file__).parent / "agentcore_memory" / "deployment_info.json"
     
-    if not info_file.exists():
+    try:
+        with open(info_file, 'rb') as f:
+            memory_info = json_loads(f.read())
+    except FileNotFoundError:
         raise FileNotFoundError(
             "AgentCore Memory must be deployed first.\n"
             "Run the following command: cd agentcore_memory && python deploy_agentcore_memory.py"
-        )
+        ) from None
     
-    with open(info_file, 'r') as f:
-        memory_info = json.load(f)
-        memory_id = memory_info["memory_id"]
-        print(f"✅ Memory ID: {memory_id}")
-        return memory_id
+    memory_id = memory_info["memory_id"]
+    print(f"✅ Memory ID: {memory_id}")
+    return memory_id
 
 def create_iam_role_with_agent_permissions():
     """Create IAM role for Fund Manager (including permissions to call other agents)"""
@@ -94,8 +101,9 @@ def _add_agent_call_permissions(role_name):
     print("🔐 Adding permissions to call other agents...")
     
     import boto3
-    iam_client = boto3.client('iam')
-    account_id = boto3.client("sts").get_caller_identity()["Account"]
+    session = boto3.Session()  # One credential resolution for both clients
+    iam_client = session.client('iam')
+    account_id = session.client("sts").get_caller_identity()["Account"]
     
     additional_policy = {
         "Version": "2012-10-17",
@@ -116,6 +124,19 @@ def _add_agent_call_permissions(role_name):
     }
     
     try:
+        # Skip the write when a previous deployment already attached the same policy
+        try:
+            current_policy = iam_client.get_role_policy(
+                RoleName=role_name,
+                PolicyName="FundManagerAgentCallsPolicy"
+            )["PolicyDocument"]
+        except iam_client.exceptions.NoSuchEntityException:
+            current_policy = None
+        
+        if current_policy == additional_policy:
+            print("✅ Agent call permissions already up to date")
+            return
+        
         iam_client.put_role_policy(
             PolicyDocument=json.dumps(additional_policy),
             PolicyName="FundManagerAgentCallsPolicy",
@@ -129,11 +150,19 @@ def deploy_fund_manager(agent_arns, memory_id):
     """Deploy Fund Manager Runtime"""
     print("🎯 Deploying Fund Manager...")
     
+    # Starter toolkit is imported here so missing-prerequisite errors are reported without loading it
+    from bedrock_agentcore_starter_toolkit import Runtime
+    
     # Create IAM role (with permissions)
     role_arn, iam_role_name = create_iam_role_with_agent_permissions()
     
     # Configure Runtime
     current_dir = Path(__file__).parent
+    
+    # The Runtime image is built from this directory only, so the shared modules are copied next to the entrypoint
+    for module_file in ("json_utils.py", "stream_utils.py"):
+        shutil.copy2(root_path / "shared" / module_file, current_dir / module_file)
+    
     runtime = Runtime()
     runtime.configure(
         entrypoint=str(current_dir / "fund_manager.py"),
@@ -156,16 +185,13 @@ def deploy_fund_manager(agent_arns, memory_id):
     # Execute deployment
     launch_result = runtime.launch(auto_update_on_conflict=True, env_vars=env_vars)
     
-    # Wait for deployment completion
-    for i in range(30):  # Wait up to 15 minutes
-        try:
-            status = runtime.status().endpoint['status']
-            print(f"📊 Status: {status} ({i*30} seconds elapsed)")
-            if status in ['READY', 'CREATE_FAILED', 'DELETE_FAILED', 'UPDATE_FAILED']:
-                break
-        except Exception as e:
-            print(f"⚠️ Status check error: {e}")
-        time.sleep(30)
+    # Wait for deployment completion (returns as soon as a terminal status is reached)
+    status = wait_for_runtime_ready(
+        launch_result.agent_id,
+        Config.REGION,
+        delay=Config.STATUS_POLL_INTERVAL,
+        max_attempts=Config.DEPLOY_TIMEOUT // Config.STATUS_POLL_INTERVAL
+    )
     
     if status != 'READY':
         raise Exception(f"Deployment failed: {status}")
@@ -197,8 +223,7 @@ def save_deployment_info(agent_info, agent_arns):
     }
     
     info_file = Path(__file__).parent / "deployment_info.json"
-    with open(info_file, 'w') as f:
-        json.dump(deployment_info, f, indent=2)
+    info_file.write_bytes(json_dumps_indented(deployment_info))
     
     return str(info_file)
 
@@ -6,34 +6,75 @@ Sequential workflow integration of 3 specialized agents with AgentCore Memory's
 for automatic session summarization and long-term context retention
 """
 
+import asyncio
 import json
+import operator
 import os
+import sys
 import boto3
-from typing import Dict, Any, TypedDict
+from botocore.config import Config as BotocoreConfig
+from typing import Annotated, Dict, Any, List, Tuple, TypedDict
 from pathlib import Path
 from datetime import datetime
 
-from langgraph.graph import StateGraph, END
 from langgraph.config import get_stream_writer
 from bedrock_agentcore.runtime import BedrockAgentCoreApp
-from bedrock_agentcore.memory import MemoryClient
+
+try:
+    # Runtime container: deploy.py copies the shared modules next to this entrypoint
+    from json_utils import json_dumps, json_loads
+    from stream_utils import iter_sse_data
+except ImportError:
+    # Local run: shared modules live at the repository root
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from shared.json_utils import json_dumps, json_loads
+    from shared.stream_utils import iter_sse_data
 
 app = BedrockAgentCoreApp()
 
+# Parsed deployment files keyed by path -> (mtime, data), so repeated loads skip parsing
+json_file_cache = {}
+
+def load_json_file(path):
+    """Load JSON file in one binary read (cached until the file's mtime changes)"""
+    with open(path, 'rb') as f:
+        mtime = os.fstat(f.fileno()).st_mtime_ns
+        cached = json_file_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        data = json_loads(f.read())
+    json_file_cache[path] = (mtime, data)
+    return data
+
 class Config:
     """Fund Manager Configuration"""
     REGION = "us-west-2"
+    STREAM_CHUNK_SIZE = 65536  # Max bytes per agent response stream read
+    # Keep-alive connections are reused across the three agent calls; the long read
+    # timeout covers gaps between events while an agent is reasoning
+    AGENT_CLIENT_CONFIG = BotocoreConfig(
+        max_pool_connections=32,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 5},
+        connect_timeout=3,
+        read_timeout=900
+    )
 
 class FundManagementState(TypedDict):
     user_input: Dict[str, Any]
+    user_input_text: str
     session_id: str
     financial_analysis: str
     portfolio_recommendation: str
     risk_analysis: str
+    # Each node returns only its own messages; the reducer appends them to the accumulated list
+    memory_messages: Annotated[List[Tuple[str, str]], operator.add]
 
 class AgentClient:
     def __init__(self):
-        self.client = boto3.client('bedrock-agentcore', region_name=Config.REGION)
+        from bedrock_agentcore.memory import MemoryClient
+        
+        self.client = boto3.client('bedrock-agentcore', region_name=Config.REGION, config=Config.AGENT_CLIENT_CONFIG)
         self.memory_client = MemoryClient(region_name=Config.REGION)
         self.arns = self._load_agent_arns()
         self.memory_id = self._load_memory_id()
@@ -59,9 +100,7 @@ class AgentClient:
         
         for agent_key, agent_dir in agent_dirs.items():
             if not arns[agent_key]:
-                info_file = base_dir / agent_dir / "deployment_info.json"
-                with open(info_file, 'r') as f:
-                    arns[agent_key] = json.load(f)["agent_arn"]
+                arns[agent_key] = load_json_file(base_dir / agent_dir / "deployment_info.json")["agent_arn"]
         
         return arns
     
@@ -72,8 +111,7 @@ class AgentClient:
             return memory_id
         
         memory_file = Path(__file__).parent / "agentcore_memory" / "deployment_info.json"
-        with open(memory_file, 'r') as f:
-            return json.load(f)["memory_id"]
+        return load_json_file(memory_file)["memory_id"]
     
     def call_agent_with_streaming(self, agent_type, data, writer):
         """Invoke agent with streaming response"""
@@ -85,43 +123,43 @@ class AgentClient:
         
         final_result = None
         
-        for line in response["response"].iter_lines(chunk_size=1):
-            if line and line.decode("utf-8").startswith("data: "):
-                try:
-                    event_data = json.loads(line.decode("utf-8")[6:])
-                    writer(event_data)
+        for payload in iter_sse_data(response["response"], Config.STREAM_CHUNK_SIZE):
+            try:
+                event_data = json_loads(payload)
+                writer(event_data)
 
-                    if event_data.get("type") == "streaming_complete":
-                        final_result = event_data.get("result")
-                
-                except json.JSONDecodeError:
-                    continue
+                if event_data.get("type") == "streaming_complete":
+                    final_result = event_data.get("result")
+            
+            except json.JSONDecodeError:
+                continue
         
         return final_result
 
-    def save_to_memory(self, session_id, agent_type, user_input, agent_result):
-        """Save conversation to memory - SUMMARY strategy automatically summarizes entire session"""
-        if not self.memory_id or not agent_result:
-            return
+    def memory_messages(self, agent_type, user_input, agent_result):
+        """Build the request/result message pair for one agent (nothing if it returned no result)"""
+        if not agent_result:
+            return []
         
-        try:
-            input_text = json.dumps(user_input, ensure_ascii=False) if isinstance(user_input, dict) else str(user_input)
-            
-            self.memory_client.create_event(
-                memory_id=self.memory_id,
-                actor_id="fund_user",
-                session_id=session_id,
-                messages=[
-                    (f"{agent_type} analysis request: {input_text}", "USER"),
-                    (f"{agent_type} result: {agent_result}", "ASSISTANT")
-                ]
-            )
-            
-            print(f"💾 {agent_type} event saved successfully (Session: {session_id})")
-            
-        except Exception as e:
-            print(f"❌ Memory save failed ({agent_type}): {e}")
+        input_text = json_dumps(user_input) if isinstance(user_input, dict) else str(user_input)
+        return [
+            (f"{agent_type} analysis request: {input_text}", "USER"),
+            (f"{agent_type} result: {agent_result}", "ASSISTANT")
+        ]
     
+    def save_to_memory(self, session_id, messages):
+        """Save the whole consultation as one event - SUMMARY strategy automatically summarizes entire session"""
+        if not self.memory_id or not messages:
+            return
+        
+        self.memory_client.create_event(
+            memory_id=self.memory_id,
+            actor_id="fund_user",
+            session_id=session_id,
+            messages=messages
+        )
+        
+        print(f"💾 Consultation event saved successfully ({len(messages)} messages, Session: {session_id})")
 
 
 agent_client = AgentClient()
@@ -136,11 +174,11 @@ def financial_node(state: FundManagementState):
     
     writer({"type": "node_complete", "agent_name": "financial", "session_id": state["session_id"], "result": result})
     
-    # Save to memory
-    agent_client.save_to_memory(state["session_id"], "financial", state["user_input"], result)
-    
-    state["financial_analysis"] = result
-    return state
+    return {
+        "financial_analysis": result,
+        # Queued for the single memory event written when the consultation ends
+        "memory_messages": agent_client.memory_messages("financial", state["user_input_text"], result)
+    }
 
 def portfolio_node(state: FundManagementState):
     """Portfolio Architecture node"""
@@ -152,11 +190,11 @@ def portfolio_node(state: FundManagementState):
     
     writer({"type": "node_complete", "agent_name": "portfolio", "session_id": state["session_id"], "result": result})
     
-    # Save to memory
-    agent_client.save_to_memory(state["session_id"], "portfolio", state["financial_analysis"], result)
-    
-    state["portfolio_recommendation"] = result
-    return state
+    return {
+        "portfolio_recommendation": result,
+        # Queued for the single memory event written when the consultation ends
+        "memory_messages": agent_client.memory_messages("portfolio", state["financial_analysis"], result)
+    }
 
 def risk_node(state: FundManagementState):
     """Risk Management node"""
@@ -168,15 +206,17 @@ def risk_node(state: FundManagementState):
     
     writer({"type": "node_complete", "agent_name": "risk", "session_id": state["session_id"], "result": result})
     
-    # Save to memory
-    agent_client.save_to_memory(state["session_id"], "risk", state["portfolio_recommendation"], result)
-    
-    state["risk_analysis"] = result
-    return state
+    return {
+        "risk_analysis": result,
+        # Queued for the single memory event written when the consultation ends
+        "memory_messages": agent_client.memory_messages("risk", state["portfolio_recommendation"], result)
+    }
 
 
 
 def create_graph():
+    from langgraph.graph import StateGraph, END
+    
     workflow = StateGraph(FundManagementState)
     
     workflow.add_node("financial", financial_node)
@@ -202,16 +242,33 @@ class FundManager:
         
         initial_state = {
             "user_input": user_input,
+            "user_input_text": json_dumps(user_input),  # Serialized once for memory writes
             "session_id": session_id,
             "financial_analysis": "",
             "portfolio_recommendation": "",
-            "risk_analysis": ""
+            "risk_analysis": "",
+            "memory_messages": []
         }
         
         config = {"configurable": {"thread_id": session_id}}
         
-        for chunk in self.graph.stream(initial_state, config=config, stream_mode="custom"):
-            yield chunk
+        # Messages from the last completed node's state, so a partial consultation is still saved
+        # if a later node fails or the client disconnects
+        memory_messages = []
+        
+        try:
+            for mode, chunk in self.graph.stream(initial_state, config=config, stream_mode=["custom", "values"]):
+                if mode == "values":
+                    memory_messages = chunk["memory_messages"]
+                else:
+                    yield chunk
+        finally:
+            # Save everything collected (the whole or partial consultation) before the response ends,
+            # off the event loop so the blocking Memory API call doesn't stall other requests
+            try:
+                await asyncio.to_thread(agent_client.save_to_memory, session_id, memory_messages)
+            except Exception as e:
+                print(f"❌ Memory save failed ({len(memory_messages)} messages lost, Session: {session_id}): {e}")
 
 advisor = None
 
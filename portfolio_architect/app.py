@@ -7,12 +7,16 @@ AI Portfolio Designer Web Interface
 
 import streamlit as st
 import json
-import boto3
-import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
+import sys
+import time
 from pathlib import Path
 
+# Shared modules live at the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from shared.chart_utils import distribution_bar_texts
+from shared.json_utils import json_loads
+from shared.stream_utils import iter_sse_data
+
 st.set_page_config(page_title="Portfolio Architect")
 st.title("🤖 Portfolio Architect")
 
@@ -26,7 +30,43 @@ except Exception:
     st.error("Deployment information not found. Please run deploy.py first.")
     st.stop()
 
-agentcore_client = boto3.client('bedrock-agentcore', region_name=REGION)
+@st.cache_resource
+def get_agentcore_client(region):
+    """Create AgentCore client shared across Streamlit reruns and sessions"""
+    import boto3
+    from botocore.config import Config as BotocoreConfig
+    
+    client_config = BotocoreConfig(
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "max_attempts": 3}
+    )
+    return boto3.client('bedrock-agentcore', region_name=region, config=client_config)
+
+agentcore_client = get_agentcore_client(REGION)
+
+# Streaming text is re-rendered at most every RENDER_INTERVAL seconds
+# unless RENDER_CHARS characters have accumulated since the last render
+RENDER_INTERVAL = 0.05
+RENDER_CHARS = 200
+
+# Response stream read size (bytes)
+STREAM_CHUNK_SIZE = 65536
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_portfolio_figure(allocation):
+    """Build portfolio allocation pie chart (cached across reruns)"""
+    import numpy as np
+    import plotly.graph_objects as go
+    
+    # Numeric arrays are sent to Plotly.js as typed arrays instead of JSON lists
+    fig = go.Figure(data=[go.Pie(
+        labels=list(allocation.keys()),
+        values=np.fromiter(allocation.values(), dtype=np.float32, count=len(allocation)),
+        hole=.3,
+        textinfo='label+percent'
+    )])
+    fig.update_layout(height=400)
+    return fig
 
 def display_portfolio_result(container, portfolio_content):
     """Display final portfolio results"""
@@ -40,14 +80,7 @@ def display_portfolio_result(container, portfolio_content):
         
         with col1:
             st.markdown("**Portfolio Allocation**")
-            fig = go.Figure(data=[go.Pie(
-                labels=list(data["portfolio_allocation"].keys()),
-                values=list(data["portfolio_allocation"].values()),
-                hole=.3,
-                textinfo='label+percent'
-            )])
-            fig.update_layout(height=400)
-            st.plotly_chart(fig)
+            st.plotly_chart(build_portfolio_figure(data["portfolio_allocation"]))
         
         with col2:
             st.markdown("**Portfolio Composition Rationale**")
@@ -82,6 +115,41 @@ def display_portfolio_result(container, portfolio_content):
     except Exception as e:
         container.error(f"Portfolio display error: {e}")
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_correlation_figure(correlation_matrix):
+    """Build ETF correlation heatmap (cached across reruns)"""
+    import numpy as np
+    import plotly.express as px
+    
+    # Build the matrix directly (matrix[column][row], same layout as a DataFrame of the dict)
+    tickers = list(correlation_matrix)
+    values = np.array(
+        [[correlation_matrix[column][row] for column in tickers] for row in tickers],
+        dtype=np.float32
+    )
+    
+    fig = px.imshow(
+        values,
+        x=tickers,
+        y=tickers,
+        color_continuous_scale='RdBu_r',
+        aspect="auto",
+        text_auto=True,
+        color_continuous_midpoint=0,
+        zmin=-1,
+        zmax=1
+    )
+    
+    fig.update_layout(
+        title="ETF Correlation Matrix",
+        height=400,
+        xaxis_title="ETF",
+        yaxis_title="ETF"
+    )
+    
+    fig.update_traces(texttemplate="%{z:.2f}", textfont_size=12)
+    return fig
+
 def display_correlation_analysis(container, correlation_data):
     """Display correlation analysis results"""
     try:
@@ -90,31 +158,8 @@ def display_correlation_analysis(container, correlation_data):
         correlation_matrix = correlation_data.get('correlation_matrix', {})
         
         if correlation_matrix:
-            # Convert correlation matrix to DataFrame
-            df = pd.DataFrame(correlation_matrix)
-            
             # Display as heatmap
-            fig = px.imshow(
-                df.values,
-                x=df.columns,
-                y=df.index,
-                color_continuous_scale='RdBu_r',
-                aspect="auto",
-                text_auto=True,
-                color_continuous_midpoint=0,
-                zmin=-1,
-                zmax=1
-            )
-            
-            fig.update_layout(
-                title="ETF Correlation Matrix",
-                height=400,
-                xaxis_title="ETF",
-                yaxis_title="ETF"
-            )
-            
-            fig.update_traces(texttemplate="%{z:.2f}", textfont_size=12)
-            container.plotly_chart(fig, width='stretch')
+            container.plotly_chart(build_correlation_figure(correlation_matrix), width='stretch')
             
             # Correlation interpretation
             container.markdown("**Correlation Interpretation**")
@@ -127,6 +172,38 @@ def display_correlation_analysis(container, correlation_data):
     except Exception as e:
         container.error(f"Correlation analysis display error: {e}")
 
+# Return distribution chart layout (shared by every ETF)
+DISTRIBUTION_LAYOUT = {
+    "title": "Expected Return Distribution After 1 Year (1000 Simulations)",
+    "xaxis_title": "Return Range",
+    "yaxis_title": "Number of Scenarios",
+    "height": 400,
+    "showlegend": False
+}
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def build_distribution_figure(ticker, distribution):
+    """Build return distribution bar chart (cached across reruns)"""
+    import numpy as np
+    import plotly.graph_objects as go
+    
+    ranges = list(distribution.keys())
+    counts = np.fromiter(distribution.values(), dtype=np.int32, count=len(distribution))
+    
+    fig = go.Figure(data=[
+        go.Bar(
+            x=ranges,
+            y=counts,
+            text=distribution_bar_texts(counts),
+            textposition='auto',
+            marker_color='lightblue',
+            name=ticker
+        )
+    ])
+    
+    fig.update_layout(**DISTRIBUTION_LAYOUT)
+    return fig
+
 def display_etf_analysis_result(container, etf_data):
     """Display individual ETF analysis results"""
     try:
@@ -161,34 +238,19 @@ def display_etf_analysis_result(container, etf_data):
         
         # Return distribution chart
         if 'return_distribution' in etf_data:
-            distribution = etf_data['return_distribution']
-            ranges = list(distribution.keys())
-            counts = list(distribution.values())
-            
-            fig = go.Figure(data=[
-                go.Bar(
-                    x=ranges,
-                    y=counts,
-                    text=[f"{count} times<br>({count/5:.1f}%)" for count in counts],
-                    textposition='auto',
-                    marker_color='lightblue',
-                    name=etf_data['ticker']
-                )
-            ])
-            
-            fig.update_layout(
-                title=f"Expected Return Distribution After 1 Year (1000 Simulations)",
-                xaxis_title="Return Range",
-                yaxis_title="Number of Scenarios",
-                height=400,
-                showlegend=False
-            )
-            
+            fig = build_distribution_figure(etf_data['ticker'], etf_data['return_distribution'])
             container.plotly_chart(fig, width='stretch')
         
     except Exception as e:
         container.error(f"ETF analysis result display error: {e}")
 
+def render_thinking(text_placeholder, chunks):
+    """Render accumulated streaming text"""
+    text = "".join(chunks)
+    if text.strip():
+        with text_placeholder.chat_message("assistant"):
+            st.markdown(text)
+
 def invoke_portfolio_architect(financial_analysis):
     """Invoke Portfolio Architect"""
     try:
@@ -201,21 +263,31 @@ def invoke_portfolio_architect(financial_analysis):
         placeholder = st.container()
         placeholder.subheader("Reasoning")
         
-        current_thinking = ""
+        current_thinking = []
+        pending_chars = 0
+        last_render = 0.0
         current_text_placeholder = placeholder.empty()
         tool_id_to_name = {}
 
-        for line in response["response"].iter_lines(chunk_size=1):
+        for payload in iter_sse_data(response["response"], STREAM_CHUNK_SIZE):
             try:
-                event_data = json.loads(line.decode("utf-8")[6:])
+                event_data = json_loads(payload)  # Parsed from bytes, no decode needed
                 event_type = event_data.get("type")
                 
+                # Flush coalesced text before handling any other event
+                if event_type != "text_chunk" and pending_chars:
+                    render_thinking(current_text_placeholder, current_thinking)
+                    pending_chars = 0
+                
                 if event_type == "text_chunk":
                     chunk_data = event_data.get("data", "")
-                    current_thinking += chunk_data
-                    if current_thinking.strip():
-                        with current_text_placeholder.chat_message("assistant"):
-                            st.markdown(current_thinking)
+                    current_thinking.append(chunk_data)
+                    pending_chars += len(chunk_data)
+                    now = time.monotonic()
+                    if pending_chars >= RENDER_CHARS or now - last_render >= RENDER_INTERVAL:
+                        render_thinking(current_text_placeholder, current_thinking)
+                        pending_chars = 0
+                        last_render = now
                 
                 elif event_type == "tool_use":
                     tool_name = event_data.get("tool_name", "")
@@ -231,7 +303,7 @@ def invoke_portfolio_architect(financial_analysis):
                     if tool_content and len(tool_content) > 0:
                         result_text = tool_content[0].get("text", "{}")
                         try:
-                            body = json.loads(result_text)
+                            body = json_loads(result_text)
                         except:
                             body = result_text
                         
@@ -240,7 +312,7 @@ def invoke_portfolio_architect(financial_analysis):
                         elif actual_tool_name == "calculate_correlation":
                             display_correlation_analysis(placeholder, body)
                     
-                    current_thinking = ""
+                    current_thinking = []
                     if tool_use_id in tool_id_to_name:
                         del tool_id_to_name[tool_use_id]
                     current_text_placeholder = placeholder.empty()
@@ -256,6 +328,9 @@ def invoke_portfolio_architect(financial_analysis):
             except json.JSONDecodeError:
                 continue
         
+        if pending_chars:
+            render_thinking(current_text_placeholder, current_thinking)
+        
         return {"status": "success"}
         
     except Exception as e:
@@ -6,13 +6,25 @@ Delete and clean up all AWS resources
 """
 
 import json
-import boto3
 import time
 import sys
+from botocore.config import Config as BotocoreConfig
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+# Add shared module path
+sys.path.insert(0, str(Path(__file__).parent.parent / "shared"))
+
+from runtime_utils import get_client
+
 # Config classes no longer needed - use region information directly from deployment info
 
+CLEANUP_WORKERS = 8      # Concurrent resource deletions
+IAM_POLICY_WORKERS = 8   # Concurrent policy delete/detach calls per role
+
+# Keep-alive connections and adaptive retries (absorbs throttling when deletions fan out)
+CLIENT_CONFIG = BotocoreConfig(tcp_keepalive=True, retries={"mode": "adaptive", "max_attempts": 10})
+
 def load_deployment_info():
     """Load deployment information"""
     current_dir = Path(__file__).parent
@@ -37,7 +49,7 @@ def delete_runtime(agent_arn, region):
     """Delete Runtime"""
     try:
         runtime_id = agent_arn.split('/')[-1]
-        client = boto3.client('bedrock-agentcore-control', region_name=region)
+        client = get_client('bedrock-agentcore-control', region, CLIENT_CONFIG)
         client.delete_agent_runtime(agentRuntimeId=runtime_id)
         print(f"✅ Runtime deleted: {runtime_id} (region: {region})")
         return True
@@ -48,7 +60,7 @@ def delete_runtime(agent_arn, region):
 def delete_ecr_repo(repo_name, region):
     """Delete ECR repository"""
     try:
-        ecr = boto3.client('ecr', region_name=region)
+        ecr = get_client('ecr', region, CLIENT_CONFIG)
         ecr.delete_repository(repositoryName=repo_name, force=True)
         print(f"✅ ECR deleted: {repo_name} (region: {region})")
         return True
@@ -59,17 +71,24 @@ def delete_ecr_repo(repo_name, region):
 def delete_iam_role(role_name):
     """Delete IAM role"""
     try:
-        iam = boto3.client('iam')
-        
-        # Delete inline policies
-        policies = iam.list_role_policies(RoleName=role_name)
-        for policy in policies['PolicyNames']:
-            iam.delete_role_policy(RoleName=role_name, PolicyName=policy)
+        iam = get_client('iam', config=CLIENT_CONFIG)
         
-        # Detach managed policies
-        attached_policies = iam.list_attached_role_policies(RoleName=role_name)
-        for policy in attached_policies['AttachedPolicies']:
-            iam.detach_role_policy(RoleName=role_name, PolicyArn=policy['PolicyArn'])
+        # Delete inline policies and detach managed policies concurrently (all pages, each
+        # page dispatched as soon as it is listed)
+        with ThreadPoolExecutor(max_workers=IAM_POLICY_WORKERS) as executor:
+            futures = []
+            for page in iam.get_paginator('list_role_policies').paginate(RoleName=role_name):
+                futures.extend(
+                    executor.submit(iam.delete_role_policy, RoleName=role_name, PolicyName=policy)
+                    for policy in page['PolicyNames']
+                )
+            for page in iam.get_paginator('list_attached_role_policies').paginate(RoleName=role_name):
+                futures.extend(
+                    executor.submit(iam.detach_role_policy, RoleName=role_name, PolicyArn=policy['PolicyArn'])
+                    for policy in page['AttachedPolicies']
+                )
+            for future in futures:
+                future.result()
         
         # Delete role
         iam.delete_role(RoleName=role_name)
@@ -84,30 +103,32 @@ def delete_iam_role(role_name):
 def delete_cognito_resources(user_pool_id, region):
     """Delete Cognito resources"""
     try:
-        cognito = boto3.client('cognito-idp', region_name=region)
+        cognito = get_client('cognito-idp', region, CLIENT_CONFIG)
         
         # 1. Delete all clients first
         try:
-            clients = cognito.list_user_pool_clients(UserPoolId=user_pool_id)
-            for client in clients['UserPoolClients']:
-                cognito.delete_user_pool_client(
-                    UserPoolId=user_pool_id,
-                    ClientId=client['ClientId']
-                )
-                print(f"✅ Cognito Client deleted: {client['ClientId']}")
+            paginator = cognito.get_paginator('list_user_pool_clients')
+            for page in paginator.paginate(UserPoolId=user_pool_id):
+                for client in page['UserPoolClients']:
+                    cognito.delete_user_pool_client(
+                        UserPoolId=user_pool_id,
+                        ClientId=client['ClientId']
+                    )
+                    print(f"✅ Cognito Client deleted: {client['ClientId']}")
         except Exception as e:
             print(f"⚠️ Client deletion failed: {e}")
         
         # 1.5. Delete resource servers
         try:
-            # List and delete resource servers
-            response = cognito.list_resource_servers(UserPoolId=user_pool_id, MaxResults=50)
-            for resource_server in response.get('ResourceServers', []):
-                cognito.delete_resource_server(
-                    UserPoolId=user_pool_id,
-                    Identifier=resource_server['Identifier']
-                )
-                print(f"✅ Resource Server deleted: {resource_server['Identifier']}")
+            # List (all pages) and delete resource servers
+            paginator = cognito.get_paginator('list_resource_servers')
+            for page in paginator.paginate(UserPoolId=user_pool_id, MaxResults=50):
+                for resource_server in page.get('ResourceServers', []):
+                    cognito.delete_resource_server(
+                        UserPoolId=user_pool_id,
+                        Identifier=resource_server['Identifier']
+                    )
+                    print(f"✅ Resource Server deleted: {resource_server['Identifier']}")
         except Exception as e:
             print(f"⚠️ Resource server deletion failed: {e}")
         
@@ -157,10 +178,12 @@ def cleanup_local_files():
     
     deleted_count = 0
     for file_path in files_to_delete:
-        if file_path.exists():
+        try:
             file_path.unlink()
-            print(f"✅ File deleted: {file_path.name}")
-            deleted_count += 1
+        except FileNotFoundError:
+            continue
+        print(f"✅ File deleted: {file_path.name}")
+        deleted_count += 1
     
     if deleted_count > 0:
         print(f"✅ Local file cleanup complete! ({deleted_count} files deleted)")
@@ -187,40 +210,44 @@ def main():
     
     print("\n🗑️ Deleting AWS resources...")
     
-    # 1. Delete Portfolio Architect Runtime
-    if portfolio_info and 'agent_arn' in portfolio_info:
-        region = portfolio_info.get('region', 'us-west-2')  # Default fallback
-        delete_runtime(portfolio_info['agent_arn'], region)
-    
-    # 2. Delete MCP Server Runtime
-    if mcp_info and 'agent_arn' in mcp_info:
-        region = mcp_info.get('region', 'us-west-2')  # Default fallback
-        delete_runtime(mcp_info['agent_arn'], region)
-    
-    # 3. Delete ECR repositories
-    if portfolio_info and 'ecr_repo_name' in portfolio_info and portfolio_info['ecr_repo_name']:
-        region = portfolio_info.get('region', 'us-west-2')
-        delete_ecr_repo(portfolio_info['ecr_repo_name'], region)
-    
-    if mcp_info and 'ecr_repo_name' in mcp_info and mcp_info['ecr_repo_name']:
-        region = mcp_info.get('region', 'us-west-2')
-        delete_ecr_repo(mcp_info['ecr_repo_name'], region)
-    
-    # 4. Delete IAM roles (IAM is global service, no region needed)
-    if portfolio_info and 'iam_role_name' in portfolio_info:
-        delete_iam_role(portfolio_info['iam_role_name'])
-    
-    if mcp_info and 'iam_role_name' in mcp_info:
-        delete_iam_role(mcp_info['iam_role_name'])
-    
-    # 5. Delete Cognito resources
-    if mcp_info and 'user_pool_id' in mcp_info:
-        region = mcp_info.get('region', 'us-west-2')
-        delete_cognito_resources(mcp_info['user_pool_id'], region)
+    with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+        futures = []
+        runtime_futures = {}
+        
+        # 1. Delete Portfolio Architect and MCP Server Runtimes
+        for key, info in (("portfolio", portfolio_info), ("mcp", mcp_info)):
+            if info and 'agent_arn' in info:
+                region = info.get('region', 'us-west-2')  # Default fallback
+                runtime_futures[key] = executor.submit(delete_runtime, info['agent_arn'], region)
+                futures.append(runtime_futures[key])
+        
+        # 2. Delete ECR repositories (independent of Runtimes, run concurrently)
+        for info in (portfolio_info, mcp_info):
+            if info and 'ecr_repo_name' in info and info['ecr_repo_name']:
+                region = info.get('region', 'us-west-2')
+                futures.append(executor.submit(delete_ecr_repo, info['ecr_repo_name'], region))
+        
+        # 3. Delete IAM roles once the Runtime using each role is deleted (IAM is global, no region needed)
+        for key, info in (("portfolio", portfolio_info), ("mcp", mcp_info)):
+            if info and 'iam_role_name' in info:
+                if key in runtime_futures:
+                    runtime_futures[key].result()
+                futures.append(executor.submit(delete_iam_role, info['iam_role_name']))
+        
+        # 4. Delete Cognito resources last (MCP Server Runtime authorizes with the pool;
+        #    steps within the pool stay sequential)
+        if mcp_info and 'user_pool_id' in mcp_info:
+            if "mcp" in runtime_futures:
+                runtime_futures["mcp"].result()
+            region = mcp_info.get('region', 'us-west-2')
+            futures.append(executor.submit(delete_cognito_resources, mcp_info['user_pool_id'], region))
+        
+        for future in as_completed(futures):
+            future.result()
     
     print("\n🎉 AWS resource cleanup complete!")
     
-    # 6. Clean up local files
+    # 5. Clean up local files
     if input("\nDo you also want to delete locally generated files? (y/N): ").lower() == 'y':
         cleanup_local_files()
     else:
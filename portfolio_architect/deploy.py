@@ -18,12 +18,14 @@ sys.path.insert(0, str(root_path))
 sys.path.insert(0, str(root_path / "shared"))
 
 from config import Config as GlobalConfig
-from runtime_utils import create_agentcore_runtime_role
+from runtime_utils import create_agentcore_runtime_role, wait_for_runtime_ready
 
 class Config:
     """Portfolio Architect deployment configuration"""
     REGION = GlobalConfig.REGION
     AGENT_NAME = GlobalConfig.PORTFOLIO_ARCHITECT_NAME
+    DEPLOY_TIMEOUT = 900       # seconds
+    STATUS_POLL_INTERVAL = 5   # seconds
 
 def load_mcp_info():
     """Load MCP Server deployment information"""
@@ -70,16 +72,13 @@ def deploy_portfolio_architect(mcp_info):
     # Execute deployment
     launch_result = runtime.launch(auto_update_on_conflict=True, env_vars=env_vars)
     
-    # Wait for deployment completion
-    for i in range(30):  # Maximum 15 minutes wait
-        try:
-            status = runtime.status().endpoint['status']
-            print(f"📊 Status: {status} ({i*30} seconds elapsed)")
-            if status in ['READY', 'CREATE_FAILED', 'DELETE_FAILED', 'UPDATE_FAILED']:
-                break
-        except Exception as e:
-            print(f"⚠️ Status check error: {e}")
-        time.sleep(30)
+    # Wait for deployment completion (returns as soon as a terminal status is reached)
+    status = wait_for_runtime_ready(
+        launch_result.agent_id,
+        Config.REGION,
+        delay=Config.STATUS_POLL_INTERVAL,
+        max_attempts=Config.DEPLOY_TIMEOUT // Config.STATUS_POLL_INTERVAL
+    )
     
     if status != 'READY':
         raise Exception(f"Deployment failed: {status}")
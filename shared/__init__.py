@@ -5,6 +5,11 @@ Common utility modules for all agents:
 - runtime_utils: AgentCore Runtime management
 - gateway_utils: AgentCore Gateway management  
 - cognito_utils: Cognito authentication management
+- command_utils: Deployment/cleanup command execution
+- stream_utils: AgentCore Runtime response stream reading
+- model_utils: Bedrock model ID helpers
+- chart_utils: Streamlit app chart helpers
+- json_utils: JSON parsing and serialization (orjson when installed)
 """
 
 __version__ = "1.0.0"
@@ -0,0 +1,27 @@
+"""
+chart_utils.py
+Common utility functions for Streamlit app charts
+
+This module provides the chart helpers shared by the Streamlit apps.
+- Monte Carlo return distribution bar labels
+"""
+
+
+def distribution_bar_texts(counts):
+    """
+    Build return distribution bar labels in NumPy instead of per-bin formatting
+
+    Args:
+        counts (Sequence[int]): Simulation count per return bin (out of 500 runs)
+
+    Returns:
+        list: Labels in the form "<count> times<br>(<count/5>%)"
+    """
+    import numpy as np
+
+    counts_arr = np.asarray(counts)
+    texts = np.char.add(
+        np.char.add(counts_arr.astype(str), " times<br>("),
+        np.char.add(np.round(counts_arr / 5.0, 1).astype(str), "%)")
+    )
+    return texts.tolist()
@@ -0,0 +1,105 @@
+"""
+command_utils.py
+Common utility functions for running deployment/cleanup commands
+
+This module provides the command runner shared by deploy_all.py and cleanup_all.py.
+- Subprocess execution with line-by-line output streaming
+- Sequential execution of the commands of a step
+- Concurrent execution of independent steps
+"""
+
+import asyncio
+import os
+
+# Max length of a single output line (StreamReader default of 64 KiB is too small for toolkit logs)
+OUTPUT_LINE_LIMIT = 16 * 1024 * 1024
+
+# Child Python scripts write unbuffered so their output streams while they run
+# (piped stdout is otherwise block-buffered and only appears at exit)
+CHILD_ENV = {**os.environ, "PYTHONUNBUFFERED": "1"}
+
+async def run_cmd(argv, cwd=None, stdin_text=None, prefix="", ignore_errors=False):
+    """
+    Execute command and stream its output line by line
+    
+    Args:
+        argv (tuple): Command and arguments (executed without a shell)
+        cwd (str): Working directory
+        stdin_text (str): Text written to the command's standard input
+        prefix (str): Prefix for each output line (e.g. step name)
+        ignore_errors (bool): Report failures as ignored warnings
+        
+    Returns:
+        bool: Whether the command succeeded
+    """
+    cmd = " ".join(argv)
+    failure_message = f"⚠️ Failed (ignored): {cmd}" if ignore_errors else f"❌ Failed: {cmd}"
+    print(f"{prefix}🔄 {cmd}")
+    
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *argv, cwd=cwd, env=CHILD_ENV,
+            stdin=asyncio.subprocess.PIPE if stdin_text is not None else None,
+            stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.STDOUT,
+            limit=OUTPUT_LINE_LIMIT
+        )
+    except OSError as e:
+        print(f"{prefix}{failure_message} ({e})")
+        return False
+    
+    if stdin_text is not None:
+        try:
+            proc.stdin.write(stdin_text.encode("utf-8"))
+            await proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            pass  # Command exited without reading its input
+        proc.stdin.close()
+    
+    async for line in proc.stdout:
+        print(f"{prefix}{line.decode('utf-8', errors='replace').rstrip()}")
+    
+    if await proc.wait() != 0:
+        print(f"{prefix}{failure_message}")
+        return False
+    
+    print(f"{prefix}✅ Completed: {cmd}")
+    return True
+
+
+async def run_step(name, commands, icon="🎯", stdin_text=None, ignore_errors=False):
+    """
+    Execute the commands of a step sequentially
+    
+    Args:
+        name (str): Step name
+        commands (list): List of (argv, cwd) tuples
+        icon (str): Icon printed with the step name
+        stdin_text (str): Text written to each command's standard input
+        ignore_errors (bool): Continue with the next command after a failure
+        
+    Returns:
+        tuple: (whether all commands succeeded, commands not run after a failure)
+    """
+    print(f"\n{icon} {name}")
+    success = True
+    for i, (argv, cwd) in enumerate(commands):
+        if not await run_cmd(argv, cwd, stdin_text, prefix=f"[{name}] ", ignore_errors=ignore_errors):
+            success = False
+            if not ignore_errors:
+                return False, commands[i + 1:]
+    return success, []
+
+
+async def run_steps(steps, **kwargs):
+    """
+    Execute independent steps concurrently
+    
+    Args:
+        steps (list): List of (name, commands) tuples
+        **kwargs: Options passed to run_step
+        
+    Returns:
+        dict: Failed step name -> commands of that step not run after the failure
+    """
+    results = await asyncio.gather(*(run_step(name, commands, **kwargs) for name, commands in steps))
+    return {name: skipped for (name, _), (ok, skipped) in zip(steps, results) if not ok}
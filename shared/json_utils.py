@@ -0,0 +1,51 @@
+"""
+json_utils.py
+Common utility functions for JSON parsing and serialization
+
+This module provides the JSON helpers shared by the agents, apps and deployment scripts.
+- orjson when installed, standard library json otherwise
+- Same output from both backends (UTF-8 text, non-ASCII kept as-is)
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson:
+    json_loads = orjson.loads
+else:
+    json_loads = json.loads
+
+
+def json_dumps(obj):
+    """
+    Serialize object to JSON text
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        str: Compact JSON text
+    """
+    if orjson:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def json_dumps_indented(obj):
+    """
+    Serialize object to indented JSON bytes for deployment info files
+
+    Args:
+        obj: JSON-serializable object
+
+    Returns:
+        bytes: UTF-8 JSON with 2-space indentation
+    """
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
@@ -0,0 +1,27 @@
+"""
+model_utils.py
+Common utility functions for Bedrock model IDs
+
+This module provides the model ID helpers shared by the agent runtimes.
+- Cross-region inference profile prefix handling
+- Base model ID lookup for per-model feature support checks
+"""
+
+# Cross-region inference profile prefixes (e.g. "us.anthropic.claude-...")
+INFERENCE_PROFILE_PREFIXES = ("global.", "us-gov.", "us.", "eu.", "apac.", "jp.", "au.")
+
+
+def normalize_model_id(model_id):
+    """
+    Strip cross-region inference profile prefix to get the base model ID
+
+    Args:
+        model_id (str): Bedrock model ID or inference profile ID
+
+    Returns:
+        str: Base model ID
+    """
+    for prefix in INFERENCE_PROFILE_PREFIXES:
+        if model_id.startswith(prefix):
+            return model_id[len(prefix):]
+    return model_id
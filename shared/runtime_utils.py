@@ -5,11 +5,56 @@ Common utility functions for AgentCore Runtime
 This module provides functions needed for AWS Bedrock AgentCore Runtime deployment.
 - IAM role creation for Runtime
 - MCP Server Runtime creation and management
+- Waiting for Runtime endpoint readiness
+- Shared boto3 session and clients for concurrent deployment/cleanup threads
 """
 
 import boto3
 import json
+import threading
 import time
+from botocore.config import Config as BotocoreConfig
+from botocore.exceptions import WaiterError
+from botocore.waiter import WaiterModel, create_waiter_with_client
+
+# One session and one client per service/region shared by all threads
+# (creation is locked because boto3 sessions are not thread-safe)
+session = None
+clients = {}
+client_lock = threading.RLock()
+
+
+def get_session():
+    """
+    Return the shared boto3 session, creating it on first use
+    
+    Returns:
+        boto3.Session: Session shared by all clients from get_client
+    """
+    global session
+    with client_lock:
+        if session is None:
+            session = boto3.Session()
+        return session
+
+
+def get_client(service_name, region_name=None, config=None):
+    """
+    Return shared boto3 client, creating it on first use
+    
+    Args:
+        service_name (str): AWS service name
+        region_name (str): AWS region (None for global services such as IAM)
+        config (BotocoreConfig): Client config, applied when the client is first created
+        
+    Returns:
+        botocore.client.BaseClient: Client shared across threads
+    """
+    key = (service_name, region_name)
+    with client_lock:
+        if key not in clients:
+            clients[key] = get_session().client(service_name, region_name=region_name, config=config)
+        return clients[key]
 
 
 def create_agentcore_runtime_role(agent_name, region):
@@ -214,4 +259,59 @@ def create_agentcore_runtime_role(agent_name, region):
     except Exception as e:
         print(f"⚠️ Policy attachment error: {e}")
 
-    return agentcore_iam_role
\ No newline at end of file
+    return agentcore_iam_role
+
+
+def wait_for_runtime_ready(agent_id, region, endpoint_name="DEFAULT", delay=5, max_attempts=180):
+    """
+    Wait until AgentCore Runtime endpoint reaches a terminal status
+    
+    bedrock-agentcore-control has no built-in waiter for Runtime endpoints,
+    so a custom botocore waiter polling GetAgentRuntimeEndpoint is used.
+    It returns as soon as the endpoint is READY or has failed.
+    
+    Args:
+        agent_id (str): AgentCore Runtime ID
+        region (str): AWS region
+        endpoint_name (str): Runtime endpoint name
+        delay (int): Seconds between status checks
+        max_attempts (int): Maximum number of status checks
+        
+    Returns:
+        str: Final endpoint status ('READY' on success)
+    """
+    # Short socket timeouts and adaptive retries so a stalled status call fails fast and is retried
+    client = boto3.client(
+        'bedrock-agentcore-control',
+        region_name=region,
+        config=BotocoreConfig(retries={"mode": "adaptive"}, read_timeout=10, connect_timeout=3)
+    )
+    waiter_model = WaiterModel({
+        "version": 2,
+        "waiters": {
+            "AgentRuntimeEndpointReady": {
+                "operation": "GetAgentRuntimeEndpoint",
+                "delay": delay,
+                "maxAttempts": max_attempts,
+                "acceptors": [
+                    {"matcher": "path", "argument": "status", "expected": "READY", "state": "success"},
+                    {"matcher": "path", "argument": "status", "expected": "CREATE_FAILED", "state": "failure"},
+                    {"matcher": "path", "argument": "status", "expected": "UPDATE_FAILED", "state": "failure"},
+                    {"matcher": "path", "argument": "status", "expected": "DELETE_FAILED", "state": "failure"},
+                    {"matcher": "error", "expected": "ResourceNotFoundException", "state": "retry"}
+                ]
+            }
+        }
+    })
+    waiter = create_waiter_with_client("AgentRuntimeEndpointReady", waiter_model, client)
+    
+    print(f"⏳ Waiting for Runtime endpoint to be READY: {agent_id}")
+    try:
+        waiter.wait(agentRuntimeId=agent_id, endpointName=endpoint_name)
+    except WaiterError as e:
+        status = (e.last_response or {}).get("status", "UNKNOWN")
+        print(f"⚠️ Runtime endpoint not ready: {status} ({e})")
+        return status
+    
+    print("✅ Runtime endpoint is READY")
+    return "READY"
\ No newline at end of file
@@ -0,0 +1,53 @@
+"""
+stream_utils.py
+Common utility functions for reading AgentCore Runtime response streams
+
+This module provides the SSE reader shared by the Streamlit apps and the Fund Manager runtime.
+- Low-latency chunked reads of the invoke_agent_runtime response stream
+- Line splitting on raw bytes, yielding only SSE data payloads
+"""
+
+import functools
+
+# SSE data line prefix (matched on raw bytes so other lines are never decoded or parsed)
+DATA_PREFIX = b"data: "
+DATA_PREFIX_LEN = len(DATA_PREFIX)
+
+
+def iter_sse_data(stream, chunk_size=65536):
+    """
+    Yield SSE data payloads from an invoke_agent_runtime response stream
+
+    Reads go through read1 of the urllib3 response wrapped by botocore's StreamingBody.
+    read1 returns whatever has already arrived (up to chunk_size), so each event is
+    yielded as soon as its line is complete. This relies on the private
+    StreamingBody._raw_stream attribute; when it is missing or has no read1 (urllib3 < 2),
+    the public iter_chunks is used instead. Its fixed-size reads block until chunk_size
+    bytes have arrived or the stream ends, so events can then be delayed by up to one chunk.
+
+    Args:
+        stream (StreamingBody): response["response"] of invoke_agent_runtime
+        chunk_size (int): Max bytes per read
+
+    Yields:
+        bytes: Payload of each 'data: ' line (JSON text, prefix stripped)
+    """
+    raw_stream = getattr(stream, "_raw_stream", None)
+    if hasattr(raw_stream, "read1"):
+        chunks = iter(functools.partial(raw_stream.read1, chunk_size), b"")
+    else:
+        chunks = stream.iter_chunks(chunk_size=chunk_size)
+
+    # Partial line carried across reads; only split once a newline has arrived
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        if b"\n" not in chunk:
+            continue
+        lines = buffer.split(b"\n")
+        buffer = lines.pop()
+        for line in lines:
+            if line.startswith(DATA_PREFIX):
+                yield bytes(line[DATA_PREFIX_LEN:])
+    if buffer.startswith(DATA_PREFIX):
+        yield bytes(buffer[DATA_PREFIX_LEN:])